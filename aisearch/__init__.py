@@ -0,0 +1,48 @@
+""" Search algorithms and graph storage for the AS1 search exercises.
+
+Importing the package has no side effects and loads none of its modules:
+each name below is imported from its module on first access, so a worker
+that only needs, say, load_graph and dijkstra never pays for the rest.
+The plain (exercise 3 and 4) searches share names, so they are only
+available from aisearch.tree_search and aisearch.graph_search.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'CSRGraph': 'csr', 'IdentityInterner': 'csr', 'NameInterner': 'csr', 'NeighborView': 'csr',
+    'FIFOFrontier': 'frontier', 'LIFOFrontier': 'frontier', 'PriorityFrontier': 'frontier',
+    'SearchNodes': 'nodes',
+    'SearchHooks': 'hooks', 'SearchCounters': 'hooks', 'SearchBudgetExceeded': 'hooks',
+    'Graph': 'graph',
+    'tree_depth_first_search': 'tree_search', 'tree_breadth_first_search': 'tree_search',
+    'tree_uniform_cost_search': 'tree_search', 'tree_greedy_search': 'tree_search',
+    'tree_a_star_search': 'tree_search',
+    'graph_depth_first_search': 'graph_search', 'graph_breadth_first_search': 'graph_search',
+    'graph_uniform_cost_search': 'graph_search', 'graph_greedy_search': 'graph_search',
+    'graph_a_star_search': 'graph_search',
+    'search_many': 'batch', 'SharedGraph': 'batch', 'DIJKSTRA': 'batch',
+    'dijkstra': 'dijkstra', 'tree_path': 'dijkstra',
+    'iterative_deepening_search': 'bounded', 'ida_star_search': 'bounded', 'sma_star_search': 'bounded',
+    'reverse_index': 'bidirectional', 'bidirectional_uniform_cost_search': 'bidirectional',
+    'bidirectional_a_star_search': 'bidirectional',
+    'LandmarkTable': 'landmarks', 'LandmarkHeuristic': 'landmarks',
+    'ShortestPathCache': 'spcache',
+    'MappedGraph': 'graphfile', 'save_graph': 'graphfile', 'load_graph': 'graphfile',
+    'convert_edge_list': 'graphfile',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
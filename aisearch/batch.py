@@ -0,0 +1,207 @@
+""" Batched origin-destination queries over a process pool.
+
+The graph arrays (and the heuristic column) are copied once into
+multiprocessing.shared_memory blocks; workers attach to those blocks by
+name and wrap them in a CSRGraph whose node names are the integer ids, so
+nothing graph sized is ever pickled. A MappedGraph (see graphfile) is not
+copied at all: workers map the same file themselves. The parent translates
+names to ids on the way out and ids back to names on the way in.
+"""
+
+import multiprocessing
+from array import array
+from itertools import islice
+from multiprocessing import shared_memory
+
+from .csr import CSRGraph, IdentityInterner, _typecode
+from .dijkstra import dijkstra, tree_path
+from .graphfile import MappedGraph, load_graph
+
+DIJKSTRA = 'dijkstra'
+
+_worker = {}
+
+
+class SharedGraph(object):
+    """ CSR arrays and heuristic column published in shared memory blocks. """
+
+    def __init__(self, csr, heuristics=None):
+        columns = {'offsets': csr.offsets, 'targets': csr.targets, 'weights': csr.weights}
+        if heuristics is not None:
+            h = [heuristics.get(name, 0) for name in csr]
+            columns['heuristics'] = array('d', h)
+        self._blocks = []
+        self.spec = {}
+        try:
+            for key, column in columns.items():
+                data = memoryview(column).cast('B')
+                block = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+                self._blocks.append(block)
+                block.buf[:len(data)] = data
+                self.spec[key] = (block.name, _typecode(column), len(column))
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        """ Release and unlink every block """
+
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FileGraph(object):
+    """ Spec telling workers to map a graph file rather than attach to shared memory. """
+
+    def __init__(self, csr, heuristics=None):
+        self.spec = {'file': (csr.path, heuristics is not None)}
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AttachedGraph(object):
+    """ Worker side view of a SharedGraph or FileGraph, built from its spec. """
+
+    def __init__(self, spec):
+        self._blocks = []
+        self._views = {}
+        self._file = None
+        if 'file' in spec:
+            path, has_heuristics = spec['file']
+            self._file = self.graph = load_graph(path, names=False)
+            self.heuristics = self._file.heuristics.column if has_heuristics else None
+            return
+        for key, (name, typecode, length) in spec.items():
+            block = shared_memory.SharedMemory(name=name)
+            self._blocks.append(block)
+            self._views[key] = block.buf.cast(typecode)[:length]
+        views = self._views
+        self.graph = CSRGraph(IdentityInterner(len(views['offsets']) - 1),
+                              views['offsets'], views['targets'], views['weights'])
+        self.heuristics = views.get('heuristics')
+
+    def close(self):
+        """ Drop the array views, then unmap the blocks (they stay linked) """
+
+        self.graph = self.heuristics = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        for view in self._views.values():
+            view.release()
+        self._views = {}
+        for block in self._blocks:
+            block.close()
+        self._blocks = []
+
+
+def _init_worker(spec):
+    _worker['attached'] = AttachedGraph(spec)
+
+
+def _run_queries(task):
+    algorithm, queries = task
+    attached = _worker['attached']
+    graph, heuristics = attached.graph, attached.heuristics
+    results = []
+    if algorithm == DIJKSTRA:
+        for source, targets in queries:
+            dist, parent = dijkstra(graph, source, targets)
+            for target in targets:
+                results.append((source, target, (tree_path(parent, target), dist.get(target))))
+    else:
+        for source, target in queries:
+            if heuristics is None:
+                result = algorithm(graph, source, target)
+            else:
+                result = algorithm(graph, source, target, heuristics)
+            results.append((source, target, result))
+    return results
+
+
+def _to_names(csr, value):
+    """ Map the ids inside a search result (lists, tuples, None) back to names """
+
+    if isinstance(value, list):
+        return [csr.name(node) for node in value]
+    if isinstance(value, tuple):
+        return tuple(_to_names(csr, item) for item in value)
+    return value
+
+
+def _tasks(csr, algorithm, pairs, batch_size, group_size):
+    """ Translate pairs to ids and cut them into per-worker tasks
+
+    For Dijkstra, pairs within each batch that share a source become one
+    (source, [targets]) query so a single expansion answers all of them.
+    """
+
+    pairs = iter(pairs)
+    while True:
+        batch = list(islice(pairs, batch_size))
+        if not batch:
+            return
+        if algorithm == DIJKSTRA:
+            grouped = {}
+            for start, target in batch:
+                grouped.setdefault(csr.id(start), []).append(csr.id(target))
+            queries = list(grouped.items())
+        else:
+            queries = [(csr.id(start), csr.id(target)) for start, target in batch]
+        for i in range(0, len(queries), group_size):
+            yield algorithm, queries[i:i + group_size]
+
+
+def search_many(csr, algorithm, pairs, heuristics=None, processes=None,
+                batch_size=10000, group_size=64):
+    """ Run algorithm for every (start, target) pair, yielding results as they finish
+
+    algorithm is either DIJKSTRA, which groups queries by start node and
+    yields (path, cost) per pair, or any search function with the
+    (graph, start, target[, heuristics]) signature of the AS1 searches,
+    which is called once per pair on an id based view of csr. Results are
+    yielded as (start, target, result) in completion order, with node ids
+    translated back to names. processes=1 runs everything in this process.
+    The same heuristics are passed to every query whatever its target, so
+    for A* to return optimal paths they must be admissible for every target
+    in pairs (exact toward a single target, or e.g. all zero).
+    When csr is a MappedGraph and heuristics is None or its own heuristics
+    column, workers map its file instead of receiving a copy.
+    """
+
+    if isinstance(csr, MappedGraph) and (heuristics is None or heuristics is csr.heuristics):
+        publish = FileGraph
+    else:
+        publish = SharedGraph
+    with publish(csr, heuristics) as shared:
+        tasks = _tasks(csr, algorithm, pairs, batch_size, group_size)
+        if processes == 1:
+            _init_worker(shared.spec)
+            try:
+                chunks = map(_run_queries, tasks)
+                for chunk in chunks:
+                    for start, target, result in chunk:
+                        yield csr.name(start), csr.name(target), _to_names(csr, result)
+            finally:
+                _worker.pop('attached').close()
+            return
+
+        with multiprocessing.Pool(processes, _init_worker, (shared.spec,)) as pool:
+            for chunk in pool.imap_unordered(_run_queries, tasks):
+                for start, target, result in chunk:
+                    yield csr.name(start), csr.name(target), _to_names(csr, result)
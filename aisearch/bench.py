@@ -0,0 +1,263 @@
+""" Benchmarks for the tree and graph searches on seeded synthetic graphs.
+
+    python -m aisearch.bench --size 400 --format csv --output bench.csv
+
+Every topology builds a {node: {neighbor: cost}} graph like the exercise
+graph, a start and target, and a consistent heuristic toward the target:
+
+- grid: 4-connected square grid, costs 1-9, Manhattan distance
+- geometric: random geometric graph in the unit square, Euclidean costs
+  and Euclidean distance
+- scalefree: Barabasi-Albert preferential attachment, costs 1-9, hop
+  distance to target
+- tree: deep, narrow random tree directed away from the root, each node
+  hanging off one of the three newest nodes so depth grows linearly
+  with size (about size / 2), costs 1-9, hop distance to a deepest leaf
+  (inf off the root-target path)
+
+Each search first runs with SearchCounters and a budget of expanded nodes,
+since tree searches on cyclic graphs need not terminate. Runs that finish
+within budget are then timed with hooks disabled, best of repeat, and run
+once more under tracemalloc for their peak memory.
+"""
+
+import argparse
+import csv
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+from . import graph_search, tree_search
+from .hooks import SearchBudgetExceeded, SearchCounters
+
+INFINITY = float('inf')
+TOPOLOGIES = ('grid', 'geometric', 'scalefree', 'tree')
+FIELDS = ('topology', 'nodes', 'edges', 'seed', 'search', 'status', 'seconds', 'expanded',
+          'generated', 'peak_frontier', 'peak_memory', 'path_length', 'path_cost')
+
+_STRATEGIES = ('depth_first_search', 'breadth_first_search', 'uniform_cost_search',
+               'greedy_search', 'a_star_search')
+SEARCHES = {}
+for _prefix, _module in (('tree', tree_search), ('graph', graph_search)):
+    for _name in _STRATEGIES:
+        SEARCHES['{}_search.{}'.format(_prefix, _name)] = getattr(_module, _name)
+    for _name in _STRATEGIES:
+        SEARCHES['{}_{}'.format(_prefix, _name)] = getattr(_module, '{}_{}'.format(_prefix, _name))
+
+
+class BenchCase(object):
+    """ One synthetic search problem. """
+
+    def __init__(self, topology, seed, graph, start, target, heuristics):
+        self.topology = topology
+        self.seed = seed
+        self.graph = graph
+        self.start = start
+        self.target = target
+        self.heuristics = heuristics
+
+    @property
+    def num_edges(self):
+        return sum(len(neighbors) for neighbors in self.graph.values())
+
+
+def _hop_heuristic(graph, target):
+    """ Edges on the fewest-edge path to target; consistent when every cost is at least 1 """
+
+    reverse = {node: [] for node in graph}
+    for node, neighbors in graph.items():
+        for neighbor in neighbors:
+            reverse[neighbor].append(node)
+    hops = {target: 0}
+    queue = deque([target])
+    while queue:
+        node = queue.popleft()
+        for predecessor in reverse[node]:
+            if predecessor not in hops:
+                hops[predecessor] = hops[node] + 1
+                queue.append(predecessor)
+    return {node: hops.get(node, INFINITY) for node in graph}
+
+
+def grid_case(size, seed=0):
+    rng = random.Random(seed)
+    side = max(2, int(math.sqrt(size)))
+    graph = {}
+    for row in range(side):
+        for col in range(side):
+            steps = ((row - 1, col), (row, col - 1), (row, col + 1), (row + 1, col))
+            graph[row * side + col] = {r * side + c: rng.randint(1, 9) for r, c in steps
+                                       if 0 <= r < side and 0 <= c < side}
+    heuristics = {node: (side - 1 - node // side) + (side - 1 - node % side) for node in graph}
+    return BenchCase('grid', seed, graph, 0, side * side - 1, heuristics)
+
+
+def geometric_case(size, seed=0):
+    rng = random.Random(seed)
+    n = max(2, size)
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+    radius = min(1.0, 1.5 * math.sqrt(math.log(n) / (math.pi * n)))
+    cells = {}
+    for node, (x, y) in enumerate(points):
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(node)
+
+    graph = {node: {} for node in range(n)}
+    for node, (x, y) in enumerate(points):
+        cx, cy = int(x / radius), int(y / radius)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for other in cells.get((cx + dx, cy + dy), ()):
+                    distance = math.dist(points[node], points[other])
+                    if other != node and distance <= radius:
+                        graph[node][other] = distance
+    for node in graph:
+        graph[node] = dict(sorted(graph[node].items()))
+
+    start = min(range(n), key=lambda node: math.dist(points[node], (0, 0)))
+    target = min(range(n), key=lambda node: math.dist(points[node], (1, 1)))
+    heuristics = {node: math.dist(points[node], points[target]) for node in graph}
+    return BenchCase('geometric', seed, graph, start, target, heuristics)
+
+
+def scalefree_case(size, seed=0, m=2):
+    rng = random.Random(seed)
+    n = max(m + 1, size)
+    graph = {node: {} for node in range(n)}
+    ends = []
+    for node in range(m + 1):
+        for other in range(node):
+            graph[node][other] = graph[other][node] = rng.randint(1, 9)
+            ends.extend((node, other))
+    for node in range(m + 1, n):
+        chosen = set()
+        while len(chosen) < m:
+            chosen.add(rng.choice(ends))
+        for other in sorted(chosen):
+            graph[node][other] = graph[other][node] = rng.randint(1, 9)
+            ends.extend((node, other))
+    for node in graph:
+        graph[node] = dict(sorted(graph[node].items()))
+
+    start, target = rng.sample(range(n), 2)
+    return BenchCase('scalefree', seed, graph, start, target, _hop_heuristic(graph, target))
+
+
+def tree_case(size, seed=0, width=3):
+    rng = random.Random(seed)
+    n = max(2, size)
+    graph = {0: {}}
+    depth = [0]
+    for node in range(1, n):
+        parent = node - 1 - rng.randrange(min(node, width))
+        graph[parent][node] = rng.randint(1, 9)
+        graph[node] = {}
+        depth.append(depth[parent] + 1)
+    deepest = max(depth)
+    target = rng.choice([node for node in range(n) if depth[node] == deepest])
+    return BenchCase('tree', seed, graph, 0, target, _hop_heuristic(graph, target))
+
+
+CASES = {'grid': grid_case, 'geometric': geometric_case, 'scalefree': scalefree_case,
+         'tree': tree_case}
+
+
+def _result_path(name, result):
+    if not isinstance(result, tuple):
+        return result
+    if name == 'tree_breadth_first_search' and result[0] is not None:
+        return result[1]
+    return result[0]
+
+
+def run_search(case, name, repeat=3, budget=100000):
+    """ Benchmark SEARCHES[name] on case and return one record (a dict over FIELDS) """
+
+    search = SEARCHES[name]
+    args = (case.graph, case.start, case.target)
+    if name.endswith(('greedy_search', 'a_star_search')):
+        args += (case.heuristics,)
+    record = dict.fromkeys(FIELDS)
+    record.update(topology=case.topology, nodes=len(case.graph), edges=case.num_edges,
+                  seed=case.seed, search=name)
+
+    counters = SearchCounters(max_expanded=budget)
+    try:
+        path = _result_path(name, search(*args, hooks=counters))
+    except SearchBudgetExceeded:
+        record.update(counters.as_dict(), status='budget')
+        return record
+    record.update(counters.as_dict(), status='found' if path else 'not found')
+    if path:
+        record['path_length'] = len(path) - 1
+        record['path_cost'] = sum(case.graph[a][b] for a, b in zip(path, path[1:]))
+
+    best = INFINITY
+    for _ in range(repeat):
+        started = time.perf_counter()
+        search(*args)
+        best = min(best, time.perf_counter() - started)
+    record['seconds'] = best
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    search(*args)
+    record['peak_memory'] = tracemalloc.get_traced_memory()[1] - baseline
+    if not tracing:
+        tracemalloc.stop()
+    return record
+
+
+def run(topologies=TOPOLOGIES, size=400, seed=0, searches=None, repeat=3, budget=100000):
+    """ Yield a record for every search on every topology """
+
+    for topology in topologies:
+        case = CASES[topology](size, seed)
+        for name in SEARCHES:
+            if searches is None or any(pattern in name for pattern in searches):
+                yield run_search(case, name, repeat, budget)
+
+
+def write_json(records, f):
+    json.dump(list(records), f, indent=2)
+    f.write('\n')
+
+
+def write_csv(records, f):
+    writer = csv.DictWriter(f, fieldnames=FIELDS)
+    writer.writeheader()
+    writer.writerows(records)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m aisearch.bench', description=__doc__.split('\n')[0])
+    parser.add_argument('--topology', action='append', choices=TOPOLOGIES,
+                        help='graph topology to run (repeatable; default all)')
+    parser.add_argument('--size', type=int, default=400, help='approximate number of nodes')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--search', action='append',
+                        help='only run searches whose name contains this (repeatable)')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per search, best is kept')
+    parser.add_argument('--budget', type=int, default=100000, help='expanded nodes before a run is abandoned')
+    parser.add_argument('--format', choices=('json', 'csv'), default='json')
+    parser.add_argument('--output', help='file to write (default stdout)')
+    options = parser.parse_args(argv)
+
+    records = run(options.topology or TOPOLOGIES, options.size, options.seed, options.search,
+                  options.repeat, options.budget)
+    write = write_json if options.format == 'json' else write_csv
+    if options.output is None:
+        write(records, sys.stdout)
+    else:
+        with open(options.output, 'w', newline='') as f:
+            write(records, f)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+""" Bidirectional uniform cost and A* search for point-to-point queries.
+
+A forward search from start and a backward search from target (over the
+reverse adjacency index) run in alternation, each always advancing the
+side whose next key is smaller. mu holds the cost of the best start-target
+path seen where the two searches touch; once the two smallest keys add up
+to at least mu, no undiscovered path can be cheaper and the search stops.
+
+Bidirectional A* uses the average potential p(v) = (h_t(v) - h_s(v)) / 2
+for the forward side and -p(v) for the backward side. Both are consistent
+whenever the heuristics are, which keeps the same stopping rule exact.
+"""
+
+from .csr import CSRGraph
+from .frontier import PriorityFrontier
+
+INFINITY = float('inf')
+
+
+def reverse_index(graph):
+    """ {node: {predecessor: cost}} for a dict-of-dicts graph or a CSRGraph """
+
+    if isinstance(graph, CSRGraph):
+        return graph.reversed()
+    reverse = {node: {} for node in graph}
+    for node, neighbors in graph.items():
+        for neighbor, cost in neighbors.items():
+            reverse.setdefault(neighbor, {})[node] = cost
+    return reverse
+
+
+def _bidirectional(graph, reverse, start, target, potential):
+    if start == target:
+        return [start], [start]
+
+    expanded_states = []
+    sides = []
+    for origin, adjacency, sign in ((start, graph, 1), (target, reverse, -1)):
+        frontier = PriorityFrontier()
+        frontier.push(sign * potential(origin), origin)
+        sides.append({'frontier': frontier, 'adjacency': adjacency, 'sign': sign,
+                      'g': {origin: 0}, 'parent': {origin: None}, 'closed': set()})
+    forward, backward = sides
+    mu, meet = INFINITY, None
+
+    while forward['frontier'] and backward['frontier']:
+        if forward['frontier'].peek_priority() + backward['frontier'].peek_priority() >= mu:
+            break
+        if forward['frontier'].peek_priority() <= backward['frontier'].peek_priority():
+            side, other = forward, backward
+        else:
+            side, other = backward, forward
+
+        (_, node) = side['frontier'].pop()
+        if node in side['closed']:
+            continue
+        side['closed'].add(node)
+        expanded_states.append(node)
+        cost = side['g'][node]
+
+        for neighbor, neighbor_cost in side['adjacency'].get(node, {}).items():
+            new_cost = cost + neighbor_cost
+            if new_cost < side['g'].get(neighbor, INFINITY):
+                side['g'][neighbor] = new_cost
+                side['parent'][neighbor] = node
+                side['frontier'].push(new_cost + side['sign'] * potential(neighbor), neighbor)
+                if neighbor in other['g'] and new_cost + other['g'][neighbor] < mu:
+                    mu, meet = new_cost + other['g'][neighbor], neighbor
+
+    if meet is None:
+        return None, expanded_states
+
+    path = []
+    node = meet
+    while node is not None:
+        path.append(node)
+        node = forward['parent'][node]
+    path.reverse()
+    node = backward['parent'][meet]
+    while node is not None:
+        path.append(node)
+        node = backward['parent'][node]
+    return path, expanded_states
+
+
+def bidirectional_uniform_cost_search(graph, start, target, reverse=None):
+    """ Bidirectional Dijkstra; returns (path, expanded_states) """
+
+    if reverse is None:
+        reverse = reverse_index(graph)
+    return _bidirectional(graph, reverse, start, target, lambda node: 0)
+
+
+def bidirectional_a_star_search(graph, start, target, heuristics, reverse=None,
+                                start_heuristics=None):
+    """ Bidirectional A* with average potentials; returns (path, expanded_states)
+
+    heuristics estimates the cost from a node to target, as for the other
+    A* searches, and start_heuristics optionally estimates the cost from
+    start to a node (taken as 0 when missing). Both must be consistent for
+    the returned path to be optimal.
+    """
+
+    if reverse is None:
+        reverse = reverse_index(graph)
+    if start_heuristics is None:
+        def potential(node):
+            return heuristics[node] / 2
+    else:
+        def potential(node):
+            return (heuristics[node] - start_heuristics[node]) / 2
+    return _bidirectional(graph, reverse, start, target, potential)
@@ -0,0 +1,234 @@
+""" Memory-bounded tree searches.
+
+Like the tree_* searches they keep no closed set and return
+(path, expanded_states), but their memory does not grow with the size of
+the search tree: iterative deepening and IDA* hold one path plus its
+unexpanded siblings, SMA* holds at most max_nodes search nodes. States
+already on the current path are not revisited, so the depth-first ones
+also terminate on finite cyclic graphs.
+"""
+
+import heapq
+from itertools import count
+
+from .frontier import LIFOFrontier
+
+INFINITY = float('inf')
+
+
+def _descend(path, on_path, depth, node):
+    """ Cut the current path back to depth and step down to node """
+
+    for old in path[depth:]:
+        on_path.discard(old)
+    del path[depth:]
+    path.append(node)
+    on_path.add(node)
+
+
+def iterative_deepening_search(graph, start, target, max_depth=None):
+    """ Depth-limited DFS with limits 0, 1, 2, ... up to max_depth """
+
+    expanded_states = []
+    limit = 0
+
+    while max_depth is None or limit <= max_depth:
+        cutoff = False
+        path, on_path = [], set()
+        stack = LIFOFrontier([(start, 0)])
+
+        while stack:
+            (node, depth) = stack.pop()
+            _descend(path, on_path, depth, node)
+            expanded_states.append(node)
+
+            if node == target:
+                return list(path), expanded_states
+
+            children = [child for child in graph.get(node, []) if child not in on_path]
+            if depth == limit:
+                cutoff = cutoff or bool(children)
+                continue
+
+            for child in children:
+                stack.push((child, depth + 1))
+
+        if not cutoff:
+            break
+        limit += 1
+
+    return None, expanded_states
+
+
+def ida_star_search(graph, start, target, heuristics):
+    """ Depth-first A*: repeat with the f bound raised to the smallest f that was cut off """
+
+    expanded_states = []
+    bound = heuristics[start]
+
+    while True:
+        next_bound = INFINITY
+        path, on_path = [], set()
+        stack = LIFOFrontier([(start, 0, 0)])
+
+        while stack:
+            (node, depth, cost) = stack.pop()
+            f = cost + heuristics[node]
+            if f > bound:
+                next_bound = min(next_bound, f)
+                continue
+
+            _descend(path, on_path, depth, node)
+            expanded_states.append(node)
+
+            if node == target:
+                return list(path), expanded_states
+
+            for child, child_cost in graph.get(node, {}).items():
+                if child not in on_path:
+                    stack.push((child, depth + 1, cost + child_cost))
+
+        if next_bound == INFINITY:
+            return None, expanded_states
+        bound = next_bound
+
+
+class _SMANode(object):
+    __slots__ = ('state', 'parent', 'cost', 'g', 'f', 'depth', 'pending', 'forgotten',
+                 'children', 'version', 'alive', 'expanded')
+
+    def __init__(self, state, parent, cost, g, depth, pending):
+        self.state = state
+        self.parent = parent
+        self.cost = cost
+        self.g = g
+        self.f = 0
+        self.depth = depth
+        self.pending = pending  # never generated successors, reversed
+        self.forgotten = []     # (f, state, cost) of successors dropped from memory
+        self.children = []
+        self.version = 0
+        self.alive = True
+        self.expanded = False
+
+    def path(self):
+        path = []
+        node = self
+        while node is not None:
+            path.append(node.state)
+            node = node.parent
+        path.reverse()
+        return path
+
+
+def sma_star_search(graph, start, target, heuristics, max_nodes=1000):
+    """ Simplified memory-bounded A* holding at most max_nodes search nodes
+
+    Successors are generated one at a time from the deepest lowest-f node.
+    When memory is full the shallowest highest-f leaf is forgotten and its
+    parent remembers its f, regenerating it only once that f is again the
+    lowest. Once every successor has been generated, a node's f is backed up
+    to the lowest f among its children, remembered or in memory. Nodes whose
+    f becomes infinite (dead ends, or paths too long to fit in memory) are
+    dropped for good. Optimal whenever the cheapest solution path fits in
+    max_nodes.
+    """
+
+    if max_nodes < 2:
+        raise ValueError('sma_star_search needs room for at least two nodes')
+
+    expanded_states = []
+    seq = count()
+    open_heap = []   # (f, -depth, seq, version, node): next node to expand
+    leaf_heap = []   # (-f, depth, seq, version, node): next leaf to forget
+    memory = set()
+
+    def successors(state, parent):
+        on_path = {state}
+        while parent is not None:
+            on_path.add(parent.state)
+            parent = parent.parent
+        return [(child, cost) for child, cost in reversed(list(graph.get(state, {}).items()))
+                if child not in on_path]
+
+    def touch(node):
+        node.version += 1
+        if node.pending or node.forgotten or node.state == target:
+            heapq.heappush(open_heap, (node.f, -node.depth, next(seq), node.version, node))
+        if not node.children and node.parent is not None:
+            heapq.heappush(leaf_heap, (-node.f, node.depth, next(seq), node.version, node))
+
+    def compact():
+        open_heap[:] = []
+        leaf_heap[:] = []
+        for node in memory:
+            touch(node)
+
+    def backup(node):
+        while node is not None and not node.pending:
+            values = [child.f for child in node.children]
+            if node.forgotten:
+                values.append(node.forgotten[0][0])
+            f = min(values) if values else INFINITY
+            if f == node.f:
+                break
+            node.f = f
+            touch(node)
+            node = node.parent
+
+    def forget(keep):
+        while leaf_heap:
+            _, _, _, version, leaf = heapq.heappop(leaf_heap)
+            if not leaf.alive or leaf.version != version or leaf.children or leaf is keep:
+                continue
+            parent = leaf.parent
+            leaf.alive = False
+            memory.discard(leaf)
+            parent.children.remove(leaf)
+            if leaf.f != INFINITY:
+                heapq.heappush(parent.forgotten, (leaf.f, leaf.state, leaf.cost))
+            backup(parent)
+            touch(parent)
+            return
+
+    root = _SMANode(start, None, 0, 0, 0, successors(start, None))
+    root.f = heuristics[start]
+    memory.add(root)
+    touch(root)
+
+    while open_heap:
+        f, _, _, version, best = heapq.heappop(open_heap)
+        if not best.alive or best.version != version:
+            continue
+        if f == INFINITY:
+            break
+
+        if not best.expanded:
+            best.expanded = True
+            expanded_states.append(best.state)
+        if best.state == target:
+            return best.path(), expanded_states
+
+        if best.pending:
+            state, cost = best.pending.pop()
+            remembered = 0
+        else:
+            remembered, state, cost = heapq.heappop(best.forgotten)
+        child = _SMANode(state, best, cost, best.g + cost, best.depth + 1, successors(state, best))
+        if state != target and (not child.pending or child.depth >= max_nodes - 1):
+            child.f = INFINITY
+        else:
+            child.f = max(best.f, child.g + heuristics[state], remembered)
+
+        if len(memory) >= max_nodes:
+            forget(keep=best)
+        best.children.append(child)
+        memory.add(child)
+        touch(child)
+        backup(best)
+        touch(best)
+
+        if len(open_heap) + len(leaf_heap) > 4 * max_nodes:
+            compact()
+
+    return None, expanded_states
@@ -0,0 +1,306 @@
+from array import array
+from collections.abc import Mapping
+
+
+class NameInterner(object):
+    """ Two-way mapping between node names and dense integer ids. """
+
+    __slots__ = ('_names', '_ids')
+
+    def __init__(self, names=()):
+        self._names = []
+        self._ids = {}
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name):
+        """ Return the id of name, assigning the next free id if it is new """
+
+        node_id = self._ids.get(name)
+        if node_id is None:
+            node_id = self._ids[name] = len(self._names)
+            self._names.append(name)
+        return node_id
+
+    def id(self, name):
+        """ Id of an already interned name (KeyError if unknown) """
+
+        return self._ids[name]
+
+    def name(self, node_id):
+        """ Name of the node with the given id """
+
+        return self._names[node_id]
+
+    def get(self, name, default=None):
+        return self._ids.get(name, default)
+
+    def __contains__(self, name):
+        return name in self._ids
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
+class IdentityInterner(object):
+    """ Interner for graphs whose node names are already the ids 0..n-1. """
+
+    __slots__ = ('_size',)
+
+    def __init__(self, size):
+        self._size = size
+
+    def intern(self, name):
+        return self.id(name)
+
+    def id(self, name):
+        if name in self:
+            return name
+        raise KeyError(name)
+
+    def name(self, node_id):
+        return node_id
+
+    def get(self, name, default=None):
+        return name if name in self else default
+
+    def __contains__(self, name):
+        return isinstance(name, int) and 0 <= name < self._size
+
+    def __iter__(self):
+        return iter(range(self._size))
+
+    def __len__(self):
+        return self._size
+
+
+def _int_typecode(low, high):
+    """ 'i' when every value fits in 32 bits, otherwise 'q' """
+
+    if -2 ** 31 <= low and high < 2 ** 31:
+        return 'i'
+    return 'q'
+
+
+def _weight_typecode(weights):
+    """ Smallest array typecode that holds every weight exactly """
+
+    if not weights:
+        return 'i'
+    if all(isinstance(w, int) for w in weights):
+        return _int_typecode(min(weights), max(weights))
+    return 'd'
+
+
+def _typecode(column):
+    """ Item format of an array or a memoryview column """
+
+    return column.typecode if isinstance(column, array) else column.format
+
+
+def _namer(interner):
+    """ Fastest id -> name callable for interner """
+
+    if isinstance(interner, NameInterner):
+        return interner._names.__getitem__
+    return interner.name
+
+
+class NeighborView(Mapping):
+    """ Read-only {neighbor_name: cost} view over one row of a CSRGraph.
+
+    Lookups scan the row; items() returns a fresh list of pairs.
+    """
+
+    __slots__ = ('_csr', '_start', '_stop')
+
+    def __init__(self, csr, node_id):
+        self._csr = csr
+        self._start = csr.offsets[node_id]
+        self._stop = csr.offsets[node_id + 1]
+
+    def __getitem__(self, name):
+        csr = self._csr
+        node_id = csr.interner.get(name)
+        if node_id is not None:
+            targets = csr.targets
+            for i in range(self._start, self._stop):
+                if targets[i] == node_id:
+                    return csr.weights[i]
+        raise KeyError(name)
+
+    def __iter__(self):
+        return map(_namer(self._csr.interner), self._csr.targets[self._start:self._stop])
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def items(self):
+        csr = self._csr
+        targets = csr.targets[self._start:self._stop]
+        weights = csr.weights[self._start:self._stop]
+        if isinstance(csr.interner, IdentityInterner):
+            return list(zip(targets, weights))
+        return list(zip(map(_namer(csr.interner), targets), weights))
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class CSRGraph(Mapping):
+    """ Immutable weighted digraph stored as compressed sparse rows.
+
+    Node names are interned to ids 0..n-1 in order of first appearance. The
+    out-edges of node u are targets[offsets[u]:offsets[u + 1]] with matching
+    weights, in the order they were given. The graph also behaves as a
+    read-only {name: {neighbor: cost}} mapping, so the dict based search
+    functions run on it unchanged. That mapping is for compatibility only:
+    every row it returns is built and name translated on the fly, so name
+    keyed searches run slower than on the dict it replaces and only save
+    memory. Code that needs speed should work on ids with edges() and
+    neighbors().
+    """
+
+    __slots__ = ('interner', 'offsets', 'targets', 'weights', '_reversed')
+
+    def __init__(self, interner, offsets, targets, weights):
+        self.interner = interner
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._reversed = None
+
+    @classmethod
+    def from_adjacency(cls, adjacency, default_weight=1):
+        """ Build from {node: {neighbor: cost}} or {node: iterable of neighbors}
+
+        Rows given as plain iterables get default_weight on every edge. Set
+        rows are unordered, so their neighbors are taken in sorted order to
+        keep the layout (and therefore every search) deterministic.
+        """
+
+        interner = NameInterner(adjacency)
+        rows = [[] for _ in range(len(interner))]
+        for node, neighbors in adjacency.items():
+            if isinstance(neighbors, Mapping):
+                pairs = neighbors.items()
+            else:
+                if isinstance(neighbors, (set, frozenset)):
+                    neighbors = sorted(neighbors)
+                pairs = [(neighbor, default_weight) for neighbor in neighbors]
+            row = rows[interner.id(node)]
+            for neighbor, cost in pairs:
+                before = len(interner)
+                row.append((interner.intern(neighbor), cost))
+                if len(interner) > before:
+                    rows.append([])
+
+        offsets = array('q', [0])
+        targets = array(_int_typecode(0, len(interner)))
+        edge_weights = []
+        for row in rows:
+            for target, cost in row:
+                targets.append(target)
+                edge_weights.append(cost)
+            offsets.append(len(targets))
+        weights = array(_weight_typecode(edge_weights), edge_weights)
+        return cls(interner, offsets, targets, weights)
+
+    @classmethod
+    def from_dict(cls, graph):
+        """ Build from the {'S': {'A': 3, ...}} dict-of-dicts layout """
+
+        return cls.from_adjacency(graph)
+
+    @classmethod
+    def from_graph(cls, graph, weight=1):
+        """ Snapshot a set based Graph object, giving every edge the same weight """
+
+        return cls.from_adjacency(graph._graph, default_weight=weight)
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def id(self, name):
+        return self.interner.id(name)
+
+    def name(self, node_id):
+        return self.interner.name(node_id)
+
+    def degree(self, node_id):
+        return self.offsets[node_id + 1] - self.offsets[node_id]
+
+    def neighbors(self, node_id):
+        """ Ids of the out-neighbors of node_id """
+
+        return self.targets[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def edges(self, node_id):
+        """ (neighbor_id, cost) pairs for the out-edges of node_id """
+
+        start, stop = self.offsets[node_id], self.offsets[node_id + 1]
+        return zip(self.targets[start:stop], self.weights[start:stop])
+
+    def reversed(self):
+        """ Graph with every edge flipped, sharing this graph's interner
+
+        Built once by a counting sort over the target column and cached, so
+        predecessor lookups cost the same as successor lookups.
+        """
+
+        if self._reversed is None:
+            n = self.num_nodes
+            offsets = array('q', [0]) * (n + 1)
+            for target in self.targets:
+                offsets[target + 1] += 1
+            for node in range(n):
+                offsets[node + 1] += offsets[node]
+            targets = array(_typecode(self.targets), [0]) * self.num_edges
+            weights = array(_typecode(self.weights), [0]) * self.num_edges
+            fill = array('q', offsets[:n])
+            for node in range(n):
+                for i in range(self.offsets[node], self.offsets[node + 1]):
+                    target = self.targets[i]
+                    targets[fill[target]] = node
+                    weights[fill[target]] = self.weights[i]
+                    fill[target] += 1
+            self._reversed = CSRGraph(self.interner, offsets, targets, weights)
+            self._reversed._reversed = self
+        return self._reversed
+
+    def nbytes(self):
+        """ Bytes held by the offset, target and weight arrays """
+
+        return sum(a.itemsize * len(a) for a in (self.offsets, self.targets, self.weights))
+
+    def to_dict(self):
+        return {name: dict(self[name].items()) for name in self}
+
+    # Mapping interface, keyed by node name
+
+    def __getitem__(self, name):
+        return NeighborView(self, self.interner.id(name))
+
+    def get(self, name, default=None):
+        node_id = self.interner.get(name)
+        return default if node_id is None else NeighborView(self, node_id)
+
+    def __iter__(self):
+        return iter(self.interner)
+
+    def __len__(self):
+        return len(self.interner)
+
+    def __contains__(self, name):
+        return name in self.interner
+
+    def __str__(self):
+        return '{}({} nodes, {} edges)'.format(self.__class__.__name__, self.num_nodes, self.num_edges)
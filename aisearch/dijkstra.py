@@ -0,0 +1,52 @@
+import heapq
+
+
+def dijkstra(csr, source, targets=None):
+    """ Shortest path tree from node id source over a CSRGraph.
+
+    The search stops as soon as every id in targets has been settled, or
+    runs to exhaustion when targets is None. Returns (dist, parent) dicts
+    covering the settled nodes; parent[source] is -1.
+
+    Uses heapq with lazy deletion: on the id based hot path the C heap is
+    about twice as fast as a decrease-key heap written in Python.
+    """
+
+    remaining = None if targets is None else set(targets)
+    dist = {}
+    best = {source: 0}
+    parent = {source: -1}
+    heap = [(0, source)]
+    offsets, nbrs, weights = csr.offsets, csr.targets, csr.weights
+
+    while heap:
+        cost, node = heapq.heappop(heap)
+        if node in dist:
+            continue
+        dist[node] = cost
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
+        for i in range(offsets[node], offsets[node + 1]):
+            neighbor = nbrs[i]
+            new_cost = cost + weights[i]
+            if neighbor not in dist and new_cost < best.get(neighbor, new_cost + 1):
+                best[neighbor] = new_cost
+                parent[neighbor] = node
+                heapq.heappush(heap, (new_cost, neighbor))
+
+    return dist, {node: parent[node] for node in dist}
+
+
+def tree_path(parent, target):
+    """ Ids from the root of a shortest path tree down to target, or None """
+
+    if target not in parent:
+        return None
+    path = []
+    while target != -1:
+        path.append(target)
+        target = parent[target]
+    path.reverse()
+    return path
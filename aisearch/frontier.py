@@ -0,0 +1,79 @@
+""" Frontier (agenda) containers shared by the search functions.
+
+Every pop and push is O(1) for the FIFO and LIFO frontiers and O(log n) for
+the heap. PriorityFrontier breaks priority ties first-in first-out, the
+same order the old push-then-stable-sort lists gave: children are pushed
+in adjacency order, which is alphabetical in the exercise graph, so that
+is the alphabetical tie-breaking rule the exercises assume.
+"""
+
+import heapq
+from collections import deque
+
+
+class FIFOFrontier(object):
+    """ First-in first-out frontier, used by breadth first search. """
+
+    __slots__ = ('_items',)
+
+    def __init__(self, items=()):
+        self._items = deque(items)
+
+    def push(self, item):
+        self._items.append(item)
+
+    def pop(self):
+        return self._items.popleft()
+
+    def __len__(self):
+        return len(self._items)
+
+
+class LIFOFrontier(object):
+    """ Last-in first-out frontier, used by depth first search. """
+
+    __slots__ = ('_items',)
+
+    def __init__(self, items=()):
+        self._items = list(items)
+
+    def push(self, item):
+        self._items.append(item)
+
+    def pop(self):
+        return self._items.pop()
+
+    def __len__(self):
+        return len(self._items)
+
+
+class PriorityFrontier(object):
+    """ Binary heap of items ordered by (priority, insertion order).
+
+    The same node may be pushed more than once; every entry is handed back
+    by pop() and it is up to the caller to skip the ones it has already
+    expanded (lazy deletion).
+    """
+
+    __slots__ = ('_heap', '_pushed')
+
+    def __init__(self):
+        self._heap = []
+        self._pushed = 0
+
+    def push(self, priority, item):
+        heapq.heappush(self._heap, (priority, self._pushed, item))
+        self._pushed += 1
+
+    def pop(self):
+        """ Remove and return (priority, item) with the lowest priority """
+
+        priority, _, item = heapq.heappop(self._heap)
+        return priority, item
+
+    def peek_priority(self):
+        return self._heap[0][0]
+
+    def __len__(self):
+        return len(self._heap)
+
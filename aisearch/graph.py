@@ -0,0 +1,88 @@
+from collections import defaultdict
+
+
+class Graph(object):
+    """ Graph data structure, undirected by default. """
+
+    def __init__(self, connections, directed=False):
+        self._graph = defaultdict(set)
+        self._directed = directed
+        self._listeners = []
+        self.add_connections(connections)
+
+    def subscribe(self, listener):
+        """ Tell listener (edge_added, edge_removed, node_removed) about every later edit """
+
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        """ Stop telling listener about edits """
+
+        self._listeners.remove(listener)
+
+    def add_connections(self, connections):
+        """ Add connections (list of tuple pairs) to graph """
+
+        for node1, node2 in connections:
+            self.add(node1, node2)
+
+    def add(self, node1, node2):
+        """ Add connection between node1 and node2 """
+
+        added = []
+        if node2 not in self._graph[node1]:
+            self._graph[node1].add(node2)
+            added.append((node1, node2))
+        if not self._directed and node1 not in self._graph[node2]:
+            self._graph[node2].add(node1)
+            added.append((node2, node1))
+        for listener in self._listeners:
+            for edge in added:
+                listener.edge_added(*edge)
+
+    def remove(self, node):
+        """ Remove all references to node """
+
+        removed = []
+        if self._directed:
+            referrers = self._graph.items()  # python3: items(); python2: iteritems()
+        else:
+            referrers = [(n, self._graph[n]) for n in self._graph.get(node, ())]
+        for n, cxns in referrers:
+            try:
+                cxns.remove(node)
+                removed.append((n, node))
+            except KeyError:
+                pass
+        removed.extend((node, n) for n in self._graph.get(node, ()))
+        try:
+            del self._graph[node]
+        except KeyError:
+            pass
+        for listener in self._listeners:
+            for edge in removed:
+                listener.edge_removed(*edge)
+            listener.node_removed(node)
+
+    def is_connected(self, node1, node2):
+        """ Is node1 directly connected to node2 """
+
+        return node1 in self._graph and node2 in self._graph[node1]
+
+    def find_path(self, node1, node2, path=[]):
+        """ Find any path between node1 and node2 (may not be shortest) """
+
+        path = path + [node1]
+        if node1 == node2:
+            return path
+        if node1 not in self._graph:
+            return None
+        for node in self._graph[node1]:
+            if node not in path:
+                new_path = self.find_path(node, node2, path)
+                if new_path:
+                    return new_path
+        return None
+
+    def __str__(self):
+        return '{}({})'.format(self.__class__.__name__, dict(self._graph))
@@ -0,0 +1,242 @@
+""" Graph search: states are expanded at most once along a closed set.
+
+The plain searches (exercise 4) return just the path, or None; the
+graph_* searches (exercise 6) return (path, expanded_states), where
+expanded_states also records states popped again after they were closed.
+Every search takes hooks, a SearchHooks to report pushes and expansions to.
+"""
+
+from .frontier import FIFOFrontier, LIFOFrontier, PriorityFrontier
+from .hooks import instrument
+from .nodes import SearchNodes
+
+
+def depth_first_search(graph, start, target, hooks=None):
+    nodes = SearchNodes(costs=False)
+    stack = instrument(LIFOFrontier([nodes.add(start)]), hooks, nodes)
+    visited = set()
+
+    while stack:
+        index = stack.pop()
+        nodes.truncate(index)
+        node = nodes.states[index]
+        visited.add(node)
+
+        if node == target:
+            return nodes.path(index)
+
+        neighbors = [neighbor for neighbor in graph.get(node, []) if neighbor not in visited]
+
+        for neighbor in neighbors:
+            stack.push(nodes.add(neighbor, index))
+
+
+def breadth_first_search(graph, start, target, hooks=None):
+    nodes = SearchNodes(costs=False)
+    queue = instrument(FIFOFrontier([nodes.add(start)]), hooks, nodes)
+    visited = set()
+
+    while queue:
+        index = queue.pop()
+        node = nodes.states[index]
+        visited.add(node)
+
+        if node == target:
+            return nodes.path(index)
+
+        neighbors = [neighbor for neighbor in graph.get(node, []) if neighbor not in visited]
+
+        for neighbor in neighbors:
+            queue.push(nodes.add(neighbor, index))
+
+
+def uniform_cost_search(graph, start, target, hooks=None):
+    nodes = SearchNodes(costs=False)
+    priority_queue = instrument(PriorityFrontier(), hooks, nodes)
+    root = nodes.add(start)
+    priority_queue.push((0, start, nodes.path_key(root)), root)
+    visited = set()
+
+    while priority_queue:
+        ((cost, node, _), index) = priority_queue.pop()
+        visited.add(node)
+
+        if node == target:
+            return nodes.path(index)
+
+        neighbors = graph.get(node, [])
+
+        for neighbor, neighbor_cost in neighbors.items():
+            if neighbor not in visited:
+                new_cost = cost + neighbor_cost
+                child = nodes.add(neighbor, index)
+                priority_queue.push((new_cost, neighbor, nodes.path_key(child)), child)
+
+
+def greedy_search(graph, start, target, heuristics, hooks=None):
+    nodes = SearchNodes(costs=False)
+    priority_queue = instrument(PriorityFrontier(), hooks, nodes)
+    root = nodes.add(start)
+    priority_queue.push((heuristics[start], start, nodes.path_key(root)), root)
+    visited = set()
+
+    while priority_queue:
+        ((_, node, _), index) = priority_queue.pop()
+        visited.add(node)
+
+        if node == target:
+            return nodes.path(index)
+
+        neighbors = graph.get(node, {})
+
+        for neighbor in sorted(neighbors, key=lambda x: heuristics[x]):
+            if neighbor not in visited:
+                child = nodes.add(neighbor, index)
+                priority_queue.push((heuristics[neighbor], neighbor, nodes.path_key(child)), child)
+
+
+def a_star_search(graph, start, target, heuristics, hooks=None):
+    nodes = SearchNodes(costs=False)
+    priority_queue = instrument(PriorityFrontier(), hooks, nodes)
+    root = nodes.add(start)
+    priority_queue.push((heuristics[start], 0, start, nodes.path_key(root)), root)
+    visited = set()
+
+    while priority_queue:
+        ((_, cost, node, _), index) = priority_queue.pop()
+
+        if node == target:
+            return nodes.path(index)
+
+        neighbors = graph.get(node, {})
+
+        for neighbor, neighbor_cost in neighbors.items():
+            new_cost = cost + neighbor_cost
+            child = nodes.add(neighbor, index)
+            priority_queue.push((new_cost + heuristics[neighbor], new_cost, neighbor, nodes.path_key(child)), child)
+
+
+def graph_depth_first_search(graph, start, target, hooks=None):
+    nodes = SearchNodes(costs=False)
+    stack = instrument(LIFOFrontier([nodes.add(start)]), hooks, nodes)
+    visited = set()
+    expanded_states = []
+
+    while stack:
+        index = stack.pop()
+        nodes.truncate(index)
+        node = nodes.states[index]
+        expanded_states.append(node)
+
+        if node == target:
+            return nodes.path(index), expanded_states
+
+        if node not in visited:
+            visited.add(node)
+            neighbors = graph.get(node, [])
+
+            for neighbor in neighbors:
+                stack.push(nodes.add(neighbor, index))
+
+    return None, expanded_states
+
+
+def graph_breadth_first_search(graph, start, target, hooks=None):
+    nodes = SearchNodes(costs=False)
+    queue = instrument(FIFOFrontier([nodes.add(start)]), hooks, nodes)
+    visited = set()
+    expanded_states = []
+
+    while queue:
+        index = queue.pop()
+        node = nodes.states[index]
+        expanded_states.append(node)
+
+        if node == target:
+            return nodes.path(index), expanded_states
+
+        if node not in visited:
+            visited.add(node)
+            neighbors = graph.get(node, [])
+
+            for neighbor in neighbors:
+                queue.push(nodes.add(neighbor, index))
+
+    return None, expanded_states
+
+
+def graph_uniform_cost_search(graph, start, target, hooks=None):
+    nodes = SearchNodes(costs=False)
+    priority_queue = instrument(PriorityFrontier(), hooks, nodes)
+    priority_queue.push(0, nodes.add(start))
+    visited = set()
+    expanded_states = []
+
+    while priority_queue:
+        (cost, index) = priority_queue.pop()
+        node = nodes.states[index]
+        expanded_states.append(node)
+
+        if node == target:
+            return nodes.path(index), expanded_states
+
+        if node not in visited:
+            visited.add(node)
+            neighbors = graph.get(node, {}).items()
+
+            for neighbor, neighbor_cost in neighbors:
+                new_cost = cost + neighbor_cost
+                priority_queue.push(new_cost, nodes.add(neighbor, index))
+
+    return None, expanded_states
+
+
+def graph_greedy_search(graph, start, target, heuristics, hooks=None):
+    nodes = SearchNodes(costs=False)
+    priority_queue = instrument(PriorityFrontier(), hooks, nodes)
+    priority_queue.push(heuristics[start], nodes.add(start))
+    visited = set()
+    expanded_states = []
+
+    while priority_queue:
+        (_, index) = priority_queue.pop()
+        node = nodes.states[index]
+        expanded_states.append(node)
+
+        if node == target:
+            return nodes.path(index), expanded_states
+
+        if node not in visited:
+            visited.add(node)
+            neighbors = graph.get(node, [])
+
+            for neighbor in sorted(neighbors, key=lambda x: heuristics[x]):
+                priority_queue.push(heuristics[neighbor], nodes.add(neighbor, index))
+
+    return None, expanded_states
+
+
+def graph_a_star_search(graph, start, target, heuristics, hooks=None):
+    nodes = SearchNodes()
+    priority_queue = instrument(PriorityFrontier(), hooks, nodes)
+    priority_queue.push(heuristics[start], nodes.add(start))
+    visited = set()
+    expanded_states = []
+
+    while priority_queue:
+        (_, index) = priority_queue.pop()
+        node, cost = nodes.states[index], nodes.costs[index]
+        expanded_states.append(node)
+
+        if node == target:
+            return nodes.path(index), expanded_states
+
+        if node not in visited:
+            visited.add(node)
+            neighbors = graph.get(node, {}).items()
+
+            for neighbor, neighbor_cost in neighbors:
+                new_cost = cost + neighbor_cost
+                priority_queue.push(new_cost + heuristics[neighbor], nodes.add(neighbor, index, new_cost))
+
+    return None, expanded_states
@@ -0,0 +1,420 @@
+""" Binary CSR graph files, loaded through mmap without parsing or copying.
+
+A file is a fixed header followed by the graph columns, each starting on
+an 8 byte boundary:
+
+    magic 'CSR1' | version | nodes | edges | target typecode | weight typecode |
+    flags | name bytes |
+    offsets ((n + 1) x int64) | targets (m) | weights (m) |
+    heuristics (n x float64, if flags & HEURISTICS) |
+    name offsets ((n + 1) x int64) | names (utf-8) |
+    name order (n x int64, ids sorted by utf-8 name; these three if flags & NAMES)
+
+load_graph() maps the file and casts memoryviews over the columns, so
+loading costs the same for any graph size and pages are only read in as a
+search touches them. Without a names section the node names are the ids
+0..n-1; names are stored as text and load back as str, and a name is
+looked up by binary search over the name order column, so nothing per
+node is built in memory either.
+
+convert_edge_list() writes a file from a text or CSV edge list in two
+streaming passes, so the edges never have to fit in memory: the first
+interns the names and counts out-degrees, the second scatters every edge
+into its row of the preallocated, mapped output file. Only per-node state
+is held in memory.
+
+    python -m aisearch.graphfile edges.csv graph.csr --undirected
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Mapping
+
+from .csr import CSRGraph, IdentityInterner, NameInterner, _int_typecode, _typecode
+
+MAGIC = b'CSR1'
+VERSION = 2
+HEURISTICS = 1
+NAMES = 2
+_HEADER = struct.Struct('<4sIQQccHQ')
+_CODES = ('i', 'q', 'd')
+
+
+def _align(position):
+    return (position + 7) & ~7
+
+
+def _layout(n, m, target_code, weight_code, flags, name_bytes):
+    """ {column: (start, size in bytes)} and the total file size """
+
+    sizes = [('offsets', 8 * (n + 1)),
+             ('targets', m * array(target_code).itemsize),
+             ('weights', m * array(weight_code).itemsize)]
+    if flags & HEURISTICS:
+        sizes.append(('heuristics', 8 * n))
+    if flags & NAMES:
+        sizes.extend((('name_offsets', 8 * (n + 1)), ('names', name_bytes), ('name_order', 8 * n)))
+    columns = {}
+    position = _align(_HEADER.size)
+    for key, size in sizes:
+        columns[key] = (position, size)
+        position = _align(position + size)
+    return columns, position
+
+
+def _formats(target_code, weight_code):
+    return {'offsets': 'q', 'targets': target_code, 'weights': weight_code,
+            'heuristics': 'd', 'name_offsets': 'q', 'names': 'B', 'name_order': 'q'}
+
+
+class MappedNames(object):
+    """ Interner over the names columns of a graph file.
+
+    name() decodes one entry in place and id() binary searches the name
+    order column, O(log n) with nothing held in memory.
+    """
+
+    __slots__ = ('_offsets', '_data', '_order')
+
+    def __init__(self, offsets, data, order):
+        self._offsets = offsets
+        self._data = data
+        self._order = order
+
+    def _encoded(self, node_id):
+        return bytes(self._data[self._offsets[node_id]:self._offsets[node_id + 1]])
+
+    def intern(self, name):
+        return self.id(name)
+
+    def id(self, name):
+        node_id = self.get(name)
+        if node_id is None:
+            raise KeyError(name)
+        return node_id
+
+    def name(self, node_id):
+        return str(self._data[self._offsets[node_id]:self._offsets[node_id + 1]], 'utf-8')
+
+    def get(self, name, default=None):
+        if not isinstance(name, str):
+            return default
+        key = name.encode('utf-8')
+        order = self._order
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            if self._encoded(order[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(order) and self._encoded(order[low]) == key:
+            return order[low]
+        return default
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def __iter__(self):
+        for node_id in range(len(self)):
+            yield self.name(node_id)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+
+class HeuristicColumn(Mapping):
+    """ The heuristics column of a graph file, indexed by node name like the heuristics dict. """
+
+    __slots__ = ('_graph', 'column')
+
+    def __init__(self, graph, column):
+        self._graph = graph
+        self.column = column
+
+    def __getitem__(self, name):
+        return self.column[self._graph.interner.id(name)]
+
+    def __iter__(self):
+        return iter(self._graph)
+
+    def __len__(self):
+        return len(self._graph)
+
+
+class MappedGraph(CSRGraph):
+    """ CSRGraph over the columns of a mapped graph file; see load_graph(). """
+
+    __slots__ = ('path', 'heuristics', '_mapped')
+
+    def __init__(self, interner, offsets, targets, weights, heuristics=None, path=None, _mapped=None):
+        CSRGraph.__init__(self, interner, offsets, targets, weights)
+        self.path = path
+        self.heuristics = None if heuristics is None else HeuristicColumn(self, heuristics)
+        self._mapped = _mapped
+
+    def close(self):
+        """ Drop the column views and unmap the file """
+
+        if self._mapped is not None:
+            views, view, mapped = self._mapped
+            self.interner = self.offsets = self.targets = self.weights = None
+            self.heuristics = self._reversed = None
+            for column in views:
+                column.release()
+            view.release()
+            mapped.close()
+            self._mapped = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def save_graph(path, csr, heuristics=None):
+    """ Write csr (and optionally a {name: estimate} heuristics mapping) to path, atomically
+
+    Graphs whose names are their ids are written without a names section.
+    """
+
+    n, m = csr.num_nodes, csr.num_edges
+    target_code, weight_code = _typecode(csr.targets), _typecode(csr.weights)
+    flags = 0
+    data = {'offsets': csr.offsets, 'targets': csr.targets, 'weights': csr.weights}
+    if heuristics is not None:
+        flags |= HEURISTICS
+        data['heuristics'] = array('d', [heuristics.get(name, 0) for name in csr])
+    name_bytes = 0
+    if not isinstance(csr.interner, IdentityInterner):
+        flags |= NAMES
+        encoded = [str(name).encode('utf-8') for name in csr]
+        name_offsets = array('q', [0])
+        for name in encoded:
+            name_offsets.append(name_offsets[-1] + len(name))
+        data['name_offsets'] = name_offsets
+        data['names'] = b''.join(encoded)
+        data['name_order'] = array('q', sorted(range(n), key=encoded.__getitem__))
+        name_bytes = len(data['names'])
+
+    columns, size = _layout(n, m, target_code, weight_code, flags, name_bytes)
+    tmp = '{}.tmp{}'.format(path, os.getpid())
+    with open(tmp, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, n, m, target_code.encode(), weight_code.encode(),
+                             flags, name_bytes))
+        for key, (start, _) in columns.items():
+            f.seek(start)
+            f.write(memoryview(data[key]).cast('B'))
+        f.truncate(size)
+    os.replace(tmp, path)
+
+
+def load_graph(path, names=True):
+    """ Map a graph file as a MappedGraph; ValueError if it is not one
+
+    With names=False the names section is ignored and nodes are addressed
+    by id, as the batch workers do.
+    """
+
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if len(mapped) < _HEADER.size:
+            raise ValueError('{} is not a graph file'.format(path))
+        magic, version, n, m, target_code, weight_code, flags, name_bytes = _HEADER.unpack_from(mapped)
+        if magic != MAGIC:
+            raise ValueError('{} is not a graph file'.format(path))
+        if version != VERSION:
+            raise ValueError('{} has graph file version {}, expected {}'.format(path, version, VERSION))
+        target_code, weight_code = target_code.decode('ascii'), weight_code.decode('ascii')
+        if target_code not in _CODES or weight_code not in _CODES:
+            raise ValueError('{} has unknown column types {!r}, {!r}'.format(path, target_code, weight_code))
+        columns, size = _layout(n, m, target_code, weight_code, flags, name_bytes)
+        if len(mapped) != size:
+            raise ValueError('{} is truncated'.format(path))
+    except BaseException:
+        mapped.close()
+        raise
+
+    view = memoryview(mapped)
+    formats = _formats(target_code, weight_code)
+    views = {key: view[start:start + size].cast(formats[key]) for key, (start, size) in columns.items()}
+    if names and flags & NAMES:
+        interner = MappedNames(views['name_offsets'], views['names'], views['name_order'])
+    else:
+        interner = IdentityInterner(n)
+    return MappedGraph(interner, views['offsets'], views['targets'], views['weights'],
+                       views.get('heuristics'), path, _mapped=(list(views.values()), view, mapped))
+
+
+def _records(source, delimiter=None, skip_header=False):
+    """ Fields of each line of a text or CSV file, skipping blank lines and # comments """
+
+    with open(source, encoding='utf-8', newline='') as f:
+        if skip_header:
+            next(f, None)
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if delimiter is None:
+                yield line.replace(',', ' ').split()
+            else:
+                yield [field.strip() for field in line.split(delimiter)]
+
+
+def _number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _edges(source, directed, default_weight, delimiter, skip_header):
+    for fields in _records(source, delimiter, skip_header):
+        if len(fields) < 2:
+            raise ValueError('{}: expected "source target [weight]", got {!r}'.format(source, fields))
+        weight = _number(fields[2]) if len(fields) > 2 else default_weight
+        yield fields[0], fields[1], weight
+        if not directed:
+            yield fields[1], fields[0], weight
+
+
+def _node_id(text):
+    node_id = int(text)
+    if node_id < 0:
+        raise ValueError('node ids must not be negative, got {}'.format(node_id))
+    return node_id
+
+
+def convert_edge_list(source, path, directed=True, default_weight=1, heuristics=None,
+                      integer_ids=False, delimiter=None, skip_header=False):
+    """ Stream a "source target [weight]" edge list into a graph file at path
+
+    Fields are split on delimiter, or on commas and whitespace when it is
+    None. Missing weights are default_weight; directed=False adds every
+    edge both ways. heuristics is an optional "node estimate" file in the
+    same format (nodes it leaves out get 0). With integer_ids the nodes
+    are the integers in the file, stored without a names section, and no
+    name index is kept in memory. Returns (nodes, edges).
+    """
+
+    names = None if integer_ids else NameInterner()
+    degrees = array('q')
+    name_bytes = m = 0
+    low = high = 0
+    real = False
+    for u, v, weight in _edges(source, directed, default_weight, delimiter, skip_header):
+        if integer_ids:
+            u, v = _node_id(u), _node_id(v)
+            if max(u, v) >= len(degrees):
+                degrees.extend(array('q', [0]) * (max(u, v) + 1 - len(degrees)))
+        else:
+            for name in (u, v):
+                if name not in names:
+                    names.intern(name)
+                    degrees.append(0)
+                    name_bytes += len(name.encode('utf-8'))
+            u = names.id(u)
+        degrees[u] += 1
+        m += 1
+        if isinstance(weight, float):
+            real = True
+        else:
+            low, high = min(low, weight), max(high, weight)
+
+    n = len(degrees)
+    target_code = _int_typecode(0, n)
+    weight_code = 'd' if real else _int_typecode(low, high)
+    cast = float if real else int
+    flags = (HEURISTICS if heuristics is not None else 0) | (0 if integer_ids else NAMES)
+    columns, size = _layout(n, m, target_code, weight_code, flags, name_bytes)
+    formats = _formats(target_code, weight_code)
+
+    tmp = '{}.tmp{}'.format(path, os.getpid())
+    try:
+        with open(tmp, 'w+b') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, n, m, target_code.encode(), weight_code.encode(),
+                                 flags, name_bytes))
+            f.truncate(size)
+            with mmap.mmap(f.fileno(), size) as mapped:
+                view = memoryview(mapped)
+                views = {key: view[start:start + length].cast(formats[key])
+                         for key, (start, length) in columns.items()}
+                try:
+                    offsets, targets, weights = views['offsets'], views['targets'], views['weights']
+                    fill = degrees
+                    position = 0
+                    for node in range(n):
+                        offsets[node] = position
+                        position, fill[node] = position + degrees[node], position
+                    offsets[n] = position
+
+                    for u, v, weight in _edges(source, directed, default_weight, delimiter, skip_header):
+                        if integer_ids:
+                            u, v = int(u), int(v)
+                        else:
+                            u, v = names.id(u), names.id(v)
+                        i = fill[u]
+                        targets[i] = v
+                        weights[i] = cast(weight)
+                        fill[u] = i + 1
+
+                    if names is not None:
+                        name_offsets, data = views['name_offsets'], views['names']
+                        position = 0
+                        for node_id, name in enumerate(names):
+                            encoded = name.encode('utf-8')
+                            name_offsets[node_id] = position
+                            data[position:position + len(encoded)] = encoded
+                            position += len(encoded)
+                        name_offsets[n] = position
+                        order = views['name_order']
+                        for i, node_id in enumerate(sorted(range(n), key=lambda node_id: names.name(node_id).encode('utf-8'))):
+                            order[i] = node_id
+
+                    if heuristics is not None:
+                        column = views['heuristics']
+                        for fields in _records(heuristics, delimiter, skip_header):
+                            node = _node_id(fields[0]) if integer_ids else names.get(fields[0])
+                            if node is None or node >= n:
+                                raise ValueError('{}: heuristic for unknown node {!r}'.format(heuristics, fields[0]))
+                            column[node] = float(fields[1])
+                    mapped.flush()
+                finally:
+                    for column in views.values():
+                        column.release()
+                    view.release()
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return n, m
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m aisearch.graphfile',
+                                     description='Convert a text or CSV edge list to a binary graph file.')
+    parser.add_argument('source', help='edge list, one "source target [weight]" per line')
+    parser.add_argument('output', help='graph file to write')
+    parser.add_argument('--undirected', action='store_true', help='add every edge in both directions')
+    parser.add_argument('--weight', type=_number, default=1, help='weight of edges without one')
+    parser.add_argument('--heuristics', help='file of "node estimate" lines to store as the heuristics column')
+    parser.add_argument('--integer-ids', action='store_true', help='nodes are the integers 0..n-1')
+    parser.add_argument('--delimiter', help='field separator (default: commas and whitespace)')
+    parser.add_argument('--skip-header', action='store_true', help='ignore the first line of each file')
+    options = parser.parse_args(argv)
+
+    n, m = convert_edge_list(options.source, options.output, not options.undirected, options.weight,
+                             options.heuristics, options.integer_ids, options.delimiter,
+                             options.skip_header)
+    print('{}: {} nodes, {} edges'.format(options.output, n, m))
+
+
+if __name__ == '__main__':
+    main()
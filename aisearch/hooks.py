@@ -0,0 +1,92 @@
+""" Optional instrumentation for the search functions.
+
+Every search takes hooks=None. With None, instrument() hands the search
+its own frontier back, so a disabled hook costs one comparison per call
+and nothing per node. Otherwise the frontier is wrapped in a proxy that
+reports every push (a generated node) and every pop (an expanded node,
+counted the way expanded_states counts them) to the hooks object.
+"""
+
+from .frontier import PriorityFrontier
+
+
+class SearchHooks(object):
+    """ Callbacks a search reports to; the defaults do nothing. """
+
+    def on_push(self, state, frontier_size):
+        pass
+
+    def on_expand(self, state):
+        pass
+
+
+class SearchBudgetExceeded(RuntimeError):
+    """ Raised by SearchCounters once a search expands more than its budget. """
+
+
+class SearchCounters(SearchHooks):
+    """ Count expanded and generated nodes and the peak frontier size.
+
+    With max_expanded set, the search is aborted with SearchBudgetExceeded
+    on the first expansion past the budget, which keeps tree searches on
+    cyclic graphs from running forever.
+    """
+
+    def __init__(self, max_expanded=None):
+        self.max_expanded = max_expanded
+        self.expanded = 0
+        self.generated = 0
+        self.peak_frontier = 0
+
+    def on_push(self, state, frontier_size):
+        self.generated += 1
+        if frontier_size > self.peak_frontier:
+            self.peak_frontier = frontier_size
+
+    def on_expand(self, state):
+        self.expanded += 1
+        if self.max_expanded is not None and self.expanded > self.max_expanded:
+            raise SearchBudgetExceeded('expanded more than {} nodes'.format(self.max_expanded))
+
+    def as_dict(self):
+        return {'expanded': self.expanded, 'generated': self.generated,
+                'peak_frontier': self.peak_frontier}
+
+
+class _HookedFrontier(object):
+    __slots__ = ('_frontier', '_hooks', '_states', '_keyed')
+
+    def __init__(self, frontier, hooks, states):
+        self._frontier = frontier
+        self._hooks = hooks
+        self._states = states
+        self._keyed = isinstance(frontier, PriorityFrontier)
+
+    def push(self, *entry):
+        self._frontier.push(*entry)
+        self._hooks.on_push(self._states[entry[-1]], len(self._frontier))
+
+    def pop(self):
+        entry = self._frontier.pop()
+        self._hooks.on_expand(self._states[entry[1] if self._keyed else entry])
+        return entry
+
+    def peek_priority(self):
+        return self._frontier.peek_priority()
+
+    def __len__(self):
+        return len(self._frontier)
+
+
+def instrument(frontier, hooks, nodes):
+    """ frontier itself if hooks is None, else a proxy reporting to hooks
+
+    frontier holds indices into the SearchNodes nodes; nodes already
+    generated when it is wrapped are reported as pushes right away.
+    """
+
+    if hooks is None:
+        return frontier
+    for state in nodes.states:
+        hooks.on_push(state, len(frontier))
+    return _HookedFrontier(frontier, hooks, nodes.states)
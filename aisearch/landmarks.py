@@ -0,0 +1,213 @@
+""" Landmark (ALT) heuristics with an on-disk cache.
+
+For each of k landmarks L the table keeps the exact distances d(v, L) and
+d(L, v) for every node v, computed with Dijkstra over the graph and its
+reverse. By the triangle inequality
+
+    d(v, t) >= d(v, L) - d(t, L)    and    d(v, t) >= d(L, t) - d(L, v)
+
+so the largest of these bounds over all landmarks is an admissible and
+consistent estimate of d(v, t) for any target t. The table is stored
+node-major (the k values for one node are adjacent) in array('d') columns,
+with inf for unreachable pairs.
+
+Tables are saved as a small header followed by the raw columns, and load
+back through mmap without parsing or copying:
+
+    magic 'ALT1' | version | nodes | edges | k | graph crc32 | padding |
+    landmark ids (k x int64) | d(v, L) (n*k x float64) | d(L, v) (n*k x float64)
+
+The header is padded to 40 bytes so every column is 8 byte aligned, as in
+graph files.
+"""
+
+import mmap
+import os
+import random
+import struct
+import zlib
+from array import array
+from collections.abc import Mapping
+
+from .dijkstra import dijkstra
+
+MAGIC = b'ALT1'
+VERSION = 2
+INFINITY = float('inf')
+_HEADER = struct.Struct('<4sIQQQI4x')
+
+
+def graph_checksum(csr):
+    """ crc32 over the CSR columns, used to reject a table built for another graph """
+
+    crc = 0
+    for column in (csr.offsets, csr.targets, csr.weights):
+        crc = zlib.crc32(memoryview(column).cast('B'), crc)
+    return crc
+
+
+def _distances(csr, source):
+    dist = array('d', [INFINITY]) * csr.num_nodes
+    for node, cost in dijkstra(csr, source)[0].items():
+        dist[node] = cost
+    return dist
+
+
+class LandmarkTable(object):
+    """ Landmark distance columns for one CSRGraph. """
+
+    def __init__(self, csr, landmarks, to_landmark, from_landmark, _mapped=None):
+        self.csr = csr
+        self.landmarks = landmarks
+        self.to_landmark = to_landmark
+        self.from_landmark = from_landmark
+        self._mapped = _mapped
+
+    @property
+    def k(self):
+        return len(self.landmarks)
+
+    @classmethod
+    def build(cls, csr, k=8, seed=0):
+        """ Pick k landmarks by farthest-point selection and run 2k Dijkstras
+
+        The first landmark is the node farthest from a random start node;
+        each next one is the node farthest from all landmarks chosen so far,
+        preferring nodes no landmark reaches yet.
+        """
+
+        n = csr.num_nodes
+        k = min(k, n)
+        reverse = csr.reversed()
+        to_columns, from_columns, landmarks = [], [], []
+        if k:
+            nearest = _distances(csr, random.Random(seed).randrange(n))
+        for _ in range(k):
+            chosen = set(landmarks)
+            landmark = max((node for node in range(n) if node not in chosen),
+                           key=lambda node: (nearest[node], -node))
+            landmarks.append(landmark)
+            from_columns.append(_distances(csr, landmark))
+            to_columns.append(_distances(reverse, landmark))
+            if len(landmarks) == 1:
+                nearest = array('d', from_columns[0])
+            else:
+                for node in range(n):
+                    nearest[node] = min(nearest[node], from_columns[-1][node])
+
+        to_landmark = array('d', [INFINITY]) * (n * k)
+        from_landmark = array('d', [INFINITY]) * (n * k)
+        for i in range(k):
+            to_landmark[i::k] = to_columns[i]
+            from_landmark[i::k] = from_columns[i]
+        return cls(csr, array('q', landmarks), to_landmark, from_landmark)
+
+    def bound(self, node, target):
+        """ Lower bound on the cost from node id to target id """
+
+        k = self.k
+        to_l, from_l = self.to_landmark, self.from_landmark
+        best = 0
+        v, t = node * k, target * k
+        for i in range(k):
+            v_to, t_to = to_l[v + i], to_l[t + i]
+            if t_to != INFINITY and v_to - t_to > best:
+                best = v_to - t_to
+            l_t, l_v = from_l[t + i], from_l[v + i]
+            if l_v != INFINITY and l_t - l_v > best:
+                best = l_t - l_v
+        return best
+
+    def heuristic(self, target):
+        """ Read-only {name: estimate} mapping toward target, a drop-in for the heuristics dict """
+
+        return LandmarkHeuristic(self, self.csr.id(target))
+
+    def save(self, path):
+        """ Write the table to path (atomically, via a temporary file) """
+
+        tmp = '{}.tmp{}'.format(path, os.getpid())
+        with open(tmp, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, self.csr.num_nodes, self.csr.num_edges,
+                                 self.k, graph_checksum(self.csr)))
+            for column in (self.landmarks, self.to_landmark, self.from_landmark):
+                f.write(memoryview(column).cast('B'))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, csr):
+        """ Map a saved table for csr; ValueError if it is stale or not a table """
+
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(mapped) < _HEADER.size:
+                raise ValueError('{} is not a landmark table'.format(path))
+            magic, version, n, m, k, crc = _HEADER.unpack_from(mapped)
+            if magic != MAGIC:
+                raise ValueError('{} is not a landmark table'.format(path))
+            if version != VERSION:
+                raise ValueError('{} has landmark table version {}, expected {}'.format(path, version, VERSION))
+            if (n, m, crc) != (csr.num_nodes, csr.num_edges, graph_checksum(csr)):
+                raise ValueError('{} was built for a different graph'.format(path))
+            if len(mapped) != _HEADER.size + 8 * k + 16 * n * k:
+                raise ValueError('{} is truncated'.format(path))
+        except BaseException:
+            mapped.close()
+            raise
+
+        view = memoryview(mapped)
+        start = _HEADER.size
+        landmarks = view[start:start + 8 * k].cast('q')
+        start += 8 * k
+        to_landmark = view[start:start + 8 * n * k].cast('d')
+        start += 8 * n * k
+        from_landmark = view[start:start + 8 * n * k].cast('d')
+        return cls(csr, landmarks, to_landmark, from_landmark, _mapped=(view, mapped))
+
+    @classmethod
+    def load_or_build(cls, path, csr, k=8, seed=0):
+        """ Load the table cached at path, rebuilding and saving it if missing or stale """
+
+        if os.path.exists(path):
+            try:
+                table = cls.load(path, csr)
+                if table.k == min(k, csr.num_nodes):
+                    return table
+                table.close()
+            except ValueError:
+                pass
+        table = cls.build(csr, k, seed)
+        table.save(path)
+        return table
+
+    def close(self):
+        """ Unmap a loaded table; built tables have nothing to release """
+
+        if self._mapped is not None:
+            view, mapped = self._mapped
+            for column in (self.landmarks, self.to_landmark, self.from_landmark):
+                column.release()
+            view.release()
+            mapped.close()
+            self._mapped = None
+            self.landmarks = self.to_landmark = self.from_landmark = None
+
+
+class LandmarkHeuristic(Mapping):
+    """ ALT estimates toward one target, indexed by node name like the heuristics dict. """
+
+    __slots__ = ('_table', '_target')
+
+    def __init__(self, table, target_id):
+        self._table = table
+        self._target = target_id
+
+    def __getitem__(self, name):
+        return self._table.bound(self._table.csr.id(name), self._target)
+
+    def __iter__(self):
+        return iter(self._table.csr)
+
+    def __len__(self):
+        return len(self._table.csr)
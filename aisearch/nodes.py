@@ -0,0 +1,86 @@
+from array import array
+
+
+class SearchNodes(object):
+    """ Flat store of generated search nodes.
+
+    Node i is the state states[i], reached from node parents[i] (-1 for the
+    root) at path cost costs[i]. Frontier entries hold just the index, so a
+    push costs O(1) instead of copying the whole path, and the path is only
+    rebuilt by path() once the goal has been reached. Searches that track no
+    path cost pass costs=False and keep no cost column at all.
+    """
+
+    __slots__ = ('states', 'parents', 'costs')
+
+    def __init__(self, costs=True):
+        self.states = []
+        self.parents = array('q')
+        self.costs = array('d') if costs else None
+
+    def add(self, state, parent=-1, cost=0):
+        """ Record a generated node and return its index """
+
+        self.states.append(state)
+        self.parents.append(parent)
+        if self.costs is not None:
+            self.costs.append(cost)
+        return len(self.states) - 1
+
+    def truncate(self, index):
+        """ Forget every node after index
+
+        With a LIFO frontier the index just popped is the highest one still
+        live: later nodes were all expanded and are on no remaining path, so
+        depth first searches call this after every pop and only ever hold
+        the current path and the siblings still waiting along it.
+        """
+
+        del self.states[index + 1:]
+        del self.parents[index + 1:]
+        if self.costs is not None:
+            del self.costs[index + 1:]
+
+    def path(self, index):
+        """ States from the root down to node index """
+
+        states, parents = self.states, self.parents
+        path = []
+        while index != -1:
+            path.append(states[index])
+            index = parents[index]
+        path.reverse()
+        return path
+
+    def path_key(self, index):
+        """ Sort key ordering nodes by their paths, as comparing path lists does """
+
+        return PathKey(self, index)
+
+    def __len__(self):
+        return len(self.states)
+
+
+class PathKey(object):
+    """ Lexicographic order of root-to-node paths, without storing them.
+
+    The plain graph searches put one last in their priority tuples to break
+    ties the way their old (cost, node, path) entries did. Tuple comparison
+    only reaches the key when everything before it is equal, so the paths
+    are rebuilt for ties alone.
+    """
+
+    __slots__ = ('_nodes', '_index')
+
+    def __init__(self, nodes, index):
+        self._nodes = nodes
+        self._index = index
+
+    def _path(self):
+        return self._nodes.path(self._index)
+
+    def __eq__(self, other):
+        return self._path() == other._path()
+
+    def __lt__(self, other):
+        return self._path() < other._path()
@@ -0,0 +1,192 @@
+""" LRU cache of shortest path trees that is repaired, not flushed, on edits.
+
+The cache subscribes to a Graph and keeps one shortest path tree (distance,
+parent and children maps) per recently used source. Every edge added or
+removed is checked against each cached tree in O(1), and only trees it
+actually changes are repaired, in the manner of dynamic shortest path
+algorithms (Ramalingam-Reps; the same local repair LPA* and D* Lite do):
+
+- an added edge u -> v that shortens the path to v re-runs Dijkstra from
+  v over the nodes whose distance drops;
+- a removed tree edge u -> v detaches the subtree under v and re-attaches
+  each of its nodes through its best predecessor outside the subtree,
+  then settles the subtree with Dijkstra;
+- any other edit leaves the tree untouched.
+
+A lookup on a cached source is then a walk up the parent map, O(path
+length). Graph edges are unweighted, so every edge costs 1.
+"""
+
+import heapq
+from collections import OrderedDict
+
+INFINITY = float('inf')
+EDGE_COST = 1
+
+
+class _Tree(object):
+    __slots__ = ('dist', 'parent', 'children')
+
+    def __init__(self):
+        self.dist = {}
+        self.parent = {}
+        self.children = {}
+
+    def attach(self, node, parent):
+        old = self.parent.get(node)
+        if old in self.children:
+            self.children[old].discard(node)
+        self.parent[node] = parent
+        if parent is not None:
+            self.children.setdefault(parent, set()).add(node)
+
+    def detach(self, node):
+        old = self.parent.pop(node, None)
+        if old in self.children:
+            self.children[old].discard(node)
+        self.dist.pop(node, None)
+
+
+class ShortestPathCache(object):
+    """ Shortest path trees for up to capacity sources of a Graph, kept valid across edits.
+
+    The cache stays subscribed to the graph until close() is called.
+    """
+
+    def __init__(self, graph, capacity=128):
+        self._graph = graph
+        self._trees = OrderedDict()
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.repairs = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self._predecessors = {}
+        for node, cxns in list(graph._graph.items()):
+            for neighbor in cxns:
+                self._predecessors.setdefault(neighbor, set()).add(node)
+        graph.subscribe(self)
+
+    def close(self):
+        """ Unsubscribe from the graph and drop every cached tree """
+
+        if self._graph is not None:
+            self._graph.unsubscribe(self)
+            self._graph = None
+        self._trees.clear()
+        self._predecessors = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def stats(self):
+        """ Counters for sizing the cache """
+
+        return {'size': len(self._trees), 'capacity': self.capacity, 'hits': self.hits,
+                'misses': self.misses, 'repairs': self.repairs,
+                'invalidations': self.invalidations, 'evictions': self.evictions}
+
+    def _successors(self, node):
+        return self._graph._graph.get(node, ())
+
+    def _settle(self, tree, heap, allowed=None):
+        """ Dijkstra from the seeded heap, only relaxing into allowed nodes if given """
+
+        dist = tree.dist
+        while heap:
+            cost, node = heapq.heappop(heap)
+            if cost > dist.get(node, INFINITY):
+                continue
+            for neighbor in self._successors(node):
+                new_cost = cost + EDGE_COST
+                if (allowed is None or neighbor in allowed) and new_cost < dist.get(neighbor, INFINITY):
+                    dist[neighbor] = new_cost
+                    tree.attach(neighbor, node)
+                    heapq.heappush(heap, (new_cost, neighbor))
+
+    def _tree(self, source):
+        tree = self._trees.get(source)
+        if tree is not None:
+            self.hits += 1
+            self._trees.move_to_end(source)
+            return tree
+
+        self.misses += 1
+        tree = _Tree()
+        tree.dist[source] = 0
+        tree.attach(source, None)
+        self._settle(tree, [(0, source)])
+        self._trees[source] = tree
+        if len(self._trees) > self.capacity:
+            self._trees.popitem(last=False)
+            self.evictions += 1
+        return tree
+
+    def path(self, source, target):
+        """ A shortest path from source to target, or None if there is none """
+
+        tree = self._tree(source)
+        if target not in tree.dist:
+            return None
+        path = []
+        node = target
+        while node is not None:
+            path.append(node)
+            node = tree.parent[node]
+        path.reverse()
+        return path
+
+    def distance(self, source, target):
+        return self._tree(source).dist.get(target, INFINITY)
+
+    # Graph listener interface
+
+    def edge_added(self, node1, node2):
+        self._predecessors.setdefault(node2, set()).add(node1)
+        for tree in self._trees.values():
+            new_cost = tree.dist.get(node1, INFINITY) + EDGE_COST
+            if new_cost < tree.dist.get(node2, INFINITY):
+                tree.dist[node2] = new_cost
+                tree.attach(node2, node1)
+                self._settle(tree, [(new_cost, node2)])
+                self.repairs += 1
+
+    def edge_removed(self, node1, node2):
+        self._predecessors.get(node2, set()).discard(node1)
+        for tree in self._trees.values():
+            if node2 in tree.parent and tree.parent[node2] == node1:
+                self._repair_removal(tree, node2)
+                self.repairs += 1
+
+    def node_removed(self, node):
+        self._predecessors.pop(node, None)
+        if self._trees.pop(node, None) is not None:
+            self.invalidations += 1
+
+    def _repair_removal(self, tree, root):
+        affected = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            affected.append(node)
+            stack.extend(tree.children.pop(node, ()))
+        for node in affected:
+            tree.detach(node)
+
+        affected_set = set(affected)
+        heap = []
+        for node in affected:
+            best, via = INFINITY, None
+            for predecessor in self._predecessors.get(node, ()):
+                cost = tree.dist.get(predecessor, INFINITY) + EDGE_COST
+                if cost < best:
+                    best, via = cost, predecessor
+            if via is not None:
+                tree.dist[node] = best
+                tree.attach(node, via)
+                heapq.heappush(heap, (best, node))
+        self._settle(tree, heap, affected_set)
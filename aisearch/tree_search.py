@@ -0,0 +1,207 @@
+""" Tree search: no closed set, so a state is expanded once per path to it.
+
+The plain searches (exercise 3) return just the path, or None. The tree_*
+searches (exercise 5) return (path, expanded_states), except
+tree_breadth_first_search, which returns (expanded_states, path) when it
+reaches target, as the exercise script has always unpacked it. Every
+search takes hooks, a SearchHooks to report pushes and expansions to.
+"""
+
+from .frontier import FIFOFrontier, LIFOFrontier, PriorityFrontier
+from .hooks import instrument
+from .nodes import SearchNodes
+
+
+def depth_first_search(graph, start, target, hooks=None):
+    nodes = SearchNodes(costs=False)
+    stack = instrument(LIFOFrontier([nodes.add(start)]), hooks, nodes)
+
+    while stack:
+        index = stack.pop()
+        nodes.truncate(index)
+        node = nodes.states[index]
+
+        if node == target:
+            return nodes.path(index)
+
+        children = graph.get(node, [])
+
+        for child in children:
+            stack.push(nodes.add(child, index))
+
+
+def breadth_first_search(tree, start, target, hooks=None):
+    nodes = SearchNodes(costs=False)
+    queue = instrument(FIFOFrontier([nodes.add(start)]), hooks, nodes)
+
+    while queue:
+        index = queue.pop()
+        node = nodes.states[index]
+
+        if node == target:
+            return nodes.path(index)
+
+        children = tree.get(node, [])
+
+        for child in children:
+            queue.push(nodes.add(child, index))
+
+
+def uniform_cost_search(graph, start, target, hooks=None):
+    nodes = SearchNodes()
+    queue = instrument(FIFOFrontier([nodes.add(start)]), hooks, nodes)
+
+    while queue:
+        index = queue.pop()
+        node, cost = nodes.states[index], nodes.costs[index]
+
+        if node == target:
+            return nodes.path(index)
+
+        children = graph.get(node, {}).items()
+
+        for child, child_cost in children:
+            queue.push(nodes.add(child, index, cost + child_cost))
+
+
+def greedy_search(graph, start, target, heuristics, hooks=None):
+    nodes = SearchNodes(costs=False)
+    queue = instrument(FIFOFrontier([nodes.add(start)]), hooks, nodes)
+
+    while queue:
+        index = queue.pop()
+        node = nodes.states[index]
+
+        if node == target:
+            return nodes.path(index)
+
+        children = graph.get(node, {}).items()
+
+        for child, _ in sorted(children, key=lambda x: heuristics[x[0]]):
+            queue.push(nodes.add(child, index))
+
+
+def a_star_search(graph, start, target, heuristics, hooks=None):
+    nodes = SearchNodes()
+    queue = instrument(PriorityFrontier(), hooks, nodes)
+    queue.push(heuristics[start], nodes.add(start))
+
+    while queue:
+        (_, index) = queue.pop()
+        node, cost = nodes.states[index], nodes.costs[index]
+
+        if node == target:
+            return nodes.path(index)
+
+        children = graph.get(node, {}).items()
+
+        for child, child_cost in children:
+            new_cost = cost + child_cost
+            queue.push(new_cost + heuristics[child], nodes.add(child, index, new_cost))
+
+
+def tree_depth_first_search(graph, start, target, hooks=None):
+    nodes = SearchNodes(costs=False)
+    stack = instrument(LIFOFrontier([nodes.add(start)]), hooks, nodes)
+    expanded_states = []
+
+    while stack:
+        index = stack.pop()
+        nodes.truncate(index)
+        node = nodes.states[index]
+        expanded_states.append(node)
+
+        if node == target:
+            return nodes.path(index), expanded_states
+
+        children = graph.get(node, [])
+
+        for child in children:
+            stack.push(nodes.add(child, index))
+
+    return None, expanded_states
+
+
+def tree_breadth_first_search(graph, start, target, hooks=None):
+    nodes = SearchNodes(costs=False)
+    queue = instrument(FIFOFrontier([nodes.add(start)]), hooks, nodes)
+    expanded_states = []  # To store the order of expanded states
+    while queue:
+        index = queue.pop()
+        node = nodes.states[index]
+        expanded_states.append(node)  # Add the expanded state to the list
+        if node == target:
+            return expanded_states, nodes.path(index)
+        children = graph.get(node, [])
+
+        for child in children:
+            queue.push(nodes.add(child, index))
+
+    return None, expanded_states
+
+
+def tree_uniform_cost_search(graph, start, target, hooks=None):
+    nodes = SearchNodes(costs=False)
+    priority_queue = instrument(PriorityFrontier(), hooks, nodes)
+    priority_queue.push(0, nodes.add(start))
+    expanded_states = []
+
+    while priority_queue:
+        (cost, index) = priority_queue.pop()
+        node = nodes.states[index]
+        expanded_states.append(node)
+
+        if node == target:
+            return nodes.path(index), expanded_states
+
+        children = graph.get(node, {}).items()
+
+        for child, child_cost in children:
+            priority_queue.push(cost + child_cost, nodes.add(child, index))
+
+    return None, expanded_states
+
+
+def tree_greedy_search(graph, start, target, heuristics, hooks=None):
+    nodes = SearchNodes(costs=False)
+    priority_queue = instrument(PriorityFrontier(), hooks, nodes)
+    priority_queue.push(heuristics[start], nodes.add(start))
+    expanded_states = []
+
+    while priority_queue:
+        (_, index) = priority_queue.pop()
+        node = nodes.states[index]
+        expanded_states.append(node)
+
+        if node == target:
+            return nodes.path(index), expanded_states
+
+        children = graph.get(node, [])
+
+        for child in sorted(children, key=lambda x: heuristics[x]):
+            priority_queue.push(heuristics[child], nodes.add(child, index))
+
+    return None, expanded_states
+
+
+def tree_a_star_search(graph, start, target, heuristics, hooks=None):
+    nodes = SearchNodes()
+    priority_queue = instrument(PriorityFrontier(), hooks, nodes)
+    priority_queue.push(heuristics[start], nodes.add(start))
+    expanded_states = []
+
+    while priority_queue:
+        (_, index) = priority_queue.pop()
+        node, cost = nodes.states[index], nodes.costs[index]
+        expanded_states.append(node)
+
+        if node == target:
+            return nodes.path(index), expanded_states
+
+        children = graph.get(node, {}).items()
+
+        for child, child_cost in children:
+            new_cost = cost + child_cost
+            priority_queue.push(new_cost + heuristics[child], nodes.add(child, index, new_cost))
+
+    return None, expanded_states
@@ -0,0 +1,44 @@
+""" Drawing helpers for the optional viz extra.
+
+networkx and matplotlib are only imported when one of these functions is
+called, so the rest of the package never needs them:
+
+    pip install ".[viz]"
+"""
+
+
+def _networkx():
+    try:
+        import networkx
+    except ImportError as exc:
+        raise ImportError('aisearch.viz needs networkx; install the viz extra: pip install ".[viz]"') from exc
+    return networkx
+
+
+def _pyplot():
+    try:
+        import matplotlib.pyplot
+    except ImportError as exc:
+        raise ImportError('aisearch.viz needs matplotlib; install the viz extra: pip install ".[viz]"') from exc
+    return matplotlib.pyplot
+
+
+def to_networkx(graph):
+    """ networkx DiGraph of a {node: {neighbor: cost}} graph or CSRGraph, costs as 'weight' """
+
+    digraph = _networkx().DiGraph()
+    digraph.add_nodes_from(graph)
+    digraph.add_weighted_edges_from((node, neighbor, cost) for node in graph
+                                    for neighbor, cost in graph[node].items())
+    return digraph
+
+
+def draw(graph, show=True):
+    """ Draw graph (ours or a networkx one) with its node labels, blocking on the window unless show is False """
+
+    networkx = _networkx()
+    if not isinstance(graph, networkx.Graph):
+        graph = to_networkx(graph)
+    networkx.draw(graph, with_labels=True)
+    if show:
+        _pyplot().show()
@@ -0,0 +1,62 @@
+import random
+
+from aisearch.batch import DIJKSTRA, search_many
+from aisearch.csr import CSRGraph
+from aisearch.dijkstra import dijkstra
+from aisearch.graph_search import graph_a_star_search, graph_uniform_cost_search
+from aisearch.graphfile import load_graph, save_graph
+
+GRAPH = {'S': {'A': 3, 'B': 1}, 'A': {'B': 2, 'C': 2}, 'B': {'C': 3}, 'C': {'D': 4, 'G': 4},
+         'D': {'G': 1}, 'G': {}, 'X': {'S': 1}}
+HEURISTICS = {'S': 7, 'A': 5, 'B': 7, 'C': 4, 'D': 1, 'G': 0, 'X': 8}
+
+
+def random_csr(seed, n=40):
+    rng = random.Random(seed)
+    return CSRGraph.from_dict({a: {b: rng.randint(1, 9) for b in range(n) if b != a and rng.random() < 0.08}
+                               for a in range(n)})
+
+
+def test_one_and_two_processes_agree():
+    csr = random_csr(0)
+    rng = random.Random(1)
+    pairs = [(rng.randrange(40), rng.randrange(40)) for _ in range(200)]
+    for algorithm in (DIJKSTRA, graph_uniform_cost_search):
+        serial = sorted(search_many(csr, algorithm, pairs, processes=1, group_size=16), key=repr)
+        parallel = sorted(search_many(csr, algorithm, pairs, processes=2, group_size=16), key=repr)
+        assert len(serial) == len(pairs)
+        assert serial == parallel
+
+
+def test_dijkstra_answers_every_pair():
+    csr = random_csr(2)
+    pairs = [(source, target) for source in range(0, 40, 7) for target in range(40)]
+    results = {(start, target): result for start, target, result
+               in search_many(csr, DIJKSTRA, pairs, processes=1)}
+    assert set(results) == set(pairs)
+    unreachable = 0
+    for (source, target), (path, cost) in results.items():
+        dist = dijkstra(csr, csr.id(source))[0]
+        if target not in dist:
+            unreachable += 1
+            assert path is None and cost is None
+        else:
+            assert cost == dist[target]
+            assert path[0] == source and path[-1] == target
+            assert sum(csr[a][b] for a, b in zip(path, path[1:])) == cost
+    assert unreachable
+
+
+def test_mapped_graph_file(tmp_path):
+    path = str(tmp_path / 'g.csr')
+    save_graph(path, CSRGraph.from_dict(GRAPH), HEURISTICS)
+    with load_graph(path) as graph:
+        pairs = [('S', target) for target in 'ABCDGX']
+        for processes in (1, 2):
+            results = {(start, target): result for start, target, result
+                       in search_many(graph, DIJKSTRA, pairs, processes=processes)}
+            assert results[('S', 'G')] == (['S', 'B', 'C', 'G'], 8)
+            assert results[('S', 'X')] == (None, None)
+            results = list(search_many(graph, graph_a_star_search, [('S', 'G')],
+                                       heuristics=graph.heuristics, processes=processes))
+            assert results == [('S', 'G', graph_a_star_search(GRAPH, 'S', 'G', HEURISTICS))]
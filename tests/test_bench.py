@@ -0,0 +1,38 @@
+import csv
+import io
+import json
+
+from aisearch.bench import FIELDS, SEARCHES, TOPOLOGIES, run, tree_case, write_csv, write_json
+
+
+def test_run_records_every_search():
+    records = list(run(size=60, repeat=1, budget=2000))
+    assert [(record['topology'], record['search']) for record in records] == \
+        [(topology, name) for topology in TOPOLOGIES for name in SEARCHES]
+    for record in records:
+        assert set(record) == set(FIELDS)
+        assert record['status'] in ('found', 'not found', 'budget')
+
+
+def test_tree_case_is_deep():
+    case = tree_case(400)
+    depth = {case.start: 0}
+    for node, children in case.graph.items():
+        for child in children:
+            depth[child] = depth[node] + 1
+    assert max(depth.values()) >= 100
+    assert depth[case.target] == max(depth.values())
+
+
+def test_writers_round_trip():
+    records = list(run(topologies=['grid'], size=30, repeat=1, searches=['a_star']))
+
+    f = io.StringIO()
+    write_json(records, f)
+    assert json.loads(f.getvalue()) == records
+
+    f = io.StringIO()
+    write_csv(records, f)
+    rows = list(csv.DictReader(io.StringIO(f.getvalue())))
+    assert rows == [{key: '' if value is None else str(value) for key, value in record.items()}
+                    for record in records]
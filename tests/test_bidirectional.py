@@ -0,0 +1,74 @@
+import heapq
+import random
+
+from aisearch.bidirectional import (INFINITY, bidirectional_a_star_search,
+                                    bidirectional_uniform_cost_search, reverse_index)
+from aisearch.csr import CSRGraph
+
+UNREACHABLE = 1000
+
+
+def dijkstra(graph, source):
+    dist = {source: 0}
+    heap = [(0, source)]
+    done = set()
+    while heap:
+        cost, node = heapq.heappop(heap)
+        if node in done:
+            continue
+        done.add(node)
+        for neighbor, neighbor_cost in graph[node].items():
+            if cost + neighbor_cost < dist.get(neighbor, INFINITY):
+                dist[neighbor] = cost + neighbor_cost
+                heapq.heappush(heap, (cost + neighbor_cost, neighbor))
+    return dist
+
+
+def scaled(dist, graph, factor):
+    """ A consistent estimate: a fraction of the exact distance, a large constant where there is none """
+
+    return {node: dist[node] * factor if node in dist else UNREACHABLE for node in graph}
+
+
+def check(graph, start, target, path, cost):
+    if cost == INFINITY:
+        assert path is None
+    else:
+        assert path[0] == start and path[-1] == target
+        assert sum(graph[a][b] for a, b in zip(path, path[1:])) == cost
+
+
+def test_costs_match_dijkstra():
+    rng = random.Random(3)
+    for _ in range(1000):
+        n = rng.randint(2, 15)
+        graph = {a: {b: rng.randint(1, 9) for b in range(n) if b != a and rng.random() < 0.25}
+                 for a in range(n)}
+        start, target = rng.randrange(n), rng.randrange(n)
+        from_start = dijkstra(graph, start)
+        to_target = dijkstra(reverse_index(graph), target)
+        cost = from_start.get(target, INFINITY)
+        heuristics = scaled(to_target, graph, 0.7)
+        start_heuristics = scaled(from_start, graph, 0.5)
+        for searched in (graph, CSRGraph.from_dict(graph)):
+            check(graph, start, target, bidirectional_uniform_cost_search(searched, start, target)[0], cost)
+            check(graph, start, target,
+                  bidirectional_a_star_search(searched, start, target, heuristics)[0], cost)
+            check(graph, start, target,
+                  bidirectional_a_star_search(searched, start, target, heuristics,
+                                              start_heuristics=start_heuristics)[0], cost)
+
+
+def test_start_is_target():
+    graph = {'S': {'A': 1}, 'A': {'S': 1}}
+    assert bidirectional_uniform_cost_search(graph, 'S', 'S') == (['S'], ['S'])
+    assert bidirectional_a_star_search(graph, 'S', 'S', {'S': 0, 'A': 1}) == (['S'], ['S'])
+
+
+def test_unreachable_target():
+    graph = {'S': {'A': 1}, 'A': {'S': 1}, 'G': {'A': 1}}
+    for searched in (graph, CSRGraph.from_dict(graph)):
+        path, expanded = bidirectional_uniform_cost_search(searched, 'S', 'G')
+        assert path is None and expanded
+        path, _ = bidirectional_a_star_search(searched, 'S', 'G', {'S': 0, 'A': 0, 'G': 0})
+        assert path is None
@@ -0,0 +1,53 @@
+import random
+
+from aisearch.bounded import INFINITY, sma_star_search
+from aisearch.csr import CSRGraph
+from aisearch.dijkstra import dijkstra
+
+
+def random_graph(rng, n):
+    return {a: {b: rng.randint(1, 9) for b in range(n) if b != a and rng.random() < 0.3}
+            for a in range(n)}
+
+
+def distances_to(graph, target):
+    reverse = {node: {} for node in graph}
+    for node, neighbors in graph.items():
+        for neighbor, cost in neighbors.items():
+            reverse[neighbor][node] = cost
+    csr = CSRGraph.from_dict(reverse)
+    dist, _ = dijkstra(csr, csr.id(target))
+    return {node: dist.get(csr.id(node), INFINITY) for node in graph}
+
+
+def path_cost(graph, path):
+    return sum(graph[a][b] for a, b in zip(path, path[1:]))
+
+
+def test_sma_star_cost_matches_dijkstra():
+    rng = random.Random(0)
+    for _ in range(300):
+        n = rng.randint(2, 12)
+        graph = random_graph(rng, n)
+        exact = distances_to(graph, n - 1)
+        for heuristics in ({node: 0 for node in graph},
+                           {node: d / 2 for node, d in exact.items()},
+                           exact):
+            path, _ = sma_star_search(graph, 0, n - 1, heuristics, max_nodes=n + 1)
+            if exact[0] == INFINITY:
+                assert path is None
+            else:
+                assert path[0] == 0 and path[-1] == n - 1
+                assert path_cost(graph, path) == exact[0]
+
+
+def test_sma_star_small_memory_returns_valid_paths():
+    rng = random.Random(1)
+    for _ in range(300):
+        n = rng.randint(2, 12)
+        graph = random_graph(rng, n)
+        exact = distances_to(graph, n - 1)
+        path, _ = sma_star_search(graph, 0, n - 1, {node: 0 for node in graph}, max_nodes=3)
+        if path is not None:
+            assert path[0] == 0 and path[-1] == n - 1
+            assert path_cost(graph, path) >= exact[0]
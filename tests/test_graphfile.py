@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from aisearch.csr import CSRGraph
+from aisearch.graphfile import convert_edge_list, load_graph, save_graph
+
+GRAPH = {'S': {'A': 3, 'B': 1}, 'A': {'B': 2, 'C': 2}, 'B': {'C': 3}, 'C': {'D': 4, 'G': 4},
+         'D': {'G': 1}, 'G': {}}
+HEURISTICS = {'S': 7, 'A': 5, 'B': 7, 'C': 4, 'D': 1, 'G': 0}
+
+
+def test_save_load_round_trip(tmp_path):
+    path = str(tmp_path / 'g.csr')
+    save_graph(path, CSRGraph.from_dict(GRAPH), HEURISTICS)
+    with load_graph(path) as graph:
+        assert graph.to_dict() == GRAPH
+        assert dict(graph.heuristics) == HEURISTICS
+
+
+def test_name_lookup(tmp_path):
+    rng = random.Random(0)
+    names = ['n{}'.format(i) for i in range(300)] + ['é', 'ζ', 'a b', '10', '9']
+    csr = CSRGraph.from_dict({name: {rng.choice(names): 1} for name in names})
+    path = str(tmp_path / 'g.csr')
+    save_graph(path, csr)
+    with load_graph(path) as graph:
+        for name in names:
+            assert graph.interner.id(name) == csr.interner.id(name)
+            assert graph.interner.name(graph.interner.id(name)) == name
+        assert 'missing' not in graph.interner and 5 not in graph.interner
+        with pytest.raises(KeyError):
+            graph.interner.id('missing')
+
+
+def test_convert_load_round_trip(tmp_path):
+    edges = str(tmp_path / 'edges.csv')
+    with open(edges, 'w') as f:
+        f.write('source,target,weight\n')
+        for node, neighbors in GRAPH.items():
+            for neighbor, cost in neighbors.items():
+                f.write('{}, {}, {}\n'.format(node, neighbor, cost))
+    estimates = str(tmp_path / 'h.csv')
+    with open(estimates, 'w') as f:
+        f.write('node,h\n')
+        for node, estimate in HEURISTICS.items():
+            f.write('{},{}\n'.format(node, estimate))
+    path = str(tmp_path / 'g.csr')
+    assert convert_edge_list(edges, path, heuristics=estimates, skip_header=True) == (6, 8)
+    with load_graph(path) as graph:
+        assert graph.to_dict() == GRAPH
+        assert dict(graph.heuristics) == HEURISTICS
+
+
+@pytest.mark.parametrize('integer_ids', [False, True])
+def test_convert_undirected(tmp_path, integer_ids):
+    rng = random.Random(1)
+    edges = [(rng.randrange(50), rng.randrange(50), rng.choice([1, 2.5, 3])) for _ in range(300)]
+    source = str(tmp_path / 'edges.txt')
+    with open(source, 'w') as f:
+        for u, v, cost in edges:
+            f.write('{} {} {}\n'.format(u, v, cost))
+    expected = {}
+    for u, v, cost in edges:
+        expected.setdefault(u, []).append((v, cost))
+        expected.setdefault(v, []).append((u, cost))
+    path = str(tmp_path / 'g.csr')
+    convert_edge_list(source, path, directed=False, integer_ids=integer_ids)
+    with load_graph(path) as graph:
+        for u, neighbors in expected.items():
+            row = graph[u if integer_ids else str(u)]
+            assert sorted((int(v), cost) for v, cost in row.items()) == sorted(neighbors)
+
+
+def test_bad_file(tmp_path):
+    path = str(tmp_path / 'bad.csr')
+    with open(path, 'wb') as f:
+        f.write(b'nope' * 20)
+    with pytest.raises(ValueError):
+        load_graph(path)
@@ -0,0 +1,87 @@
+import random
+import struct
+
+import pytest
+
+from aisearch.csr import CSRGraph
+from aisearch.dijkstra import dijkstra
+from aisearch.landmarks import INFINITY, VERSION, LandmarkTable
+
+
+def random_csr(seed, n=30):
+    rng = random.Random(seed)
+    return CSRGraph.from_dict({a: {b: rng.randint(1, 9) for b in range(n) if b != a and rng.random() < 0.06}
+                               for a in range(n)})
+
+
+def bounds(table):
+    n = table.csr.num_nodes
+    return [table.bound(v, t) for v in range(n) for t in range(n)]
+
+
+def test_bound_is_admissible():
+    unreachable = 0
+    for seed in range(20):
+        csr = random_csr(seed)
+        table = LandmarkTable.build(csr, k=4, seed=seed)
+        for v in range(csr.num_nodes):
+            dist = dijkstra(csr, v)[0]
+            for t in range(csr.num_nodes):
+                exact = dist.get(t, INFINITY)
+                unreachable += exact == INFINITY
+                assert table.bound(v, t) <= exact
+            assert table.bound(v, v) == 0
+    assert unreachable
+
+
+def test_save_load_round_trip(tmp_path):
+    csr = random_csr(0)
+    path = str(tmp_path / 'alt')
+    table = LandmarkTable.build(csr, k=4)
+    table.save(path)
+    loaded = LandmarkTable.load(path, csr)
+    try:
+        assert list(loaded.landmarks) == list(table.landmarks)
+        assert bounds(loaded) == bounds(table)
+    finally:
+        loaded.close()
+
+
+def test_load_rejects_bad_tables(tmp_path):
+    csr = random_csr(0)
+    path = str(tmp_path / 'alt')
+    LandmarkTable.build(csr, k=4).save(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    with open(path, 'wb') as f:
+        f.write(data[:4] + struct.pack('<I', VERSION + 1) + data[8:])
+    with pytest.raises(ValueError, match='version'):
+        LandmarkTable.load(path, csr)
+
+    with open(path, 'wb') as f:
+        f.write(data)
+    with pytest.raises(ValueError, match='different graph'):
+        LandmarkTable.load(path, random_csr(1))
+    with pytest.raises(ValueError, match='different graph'):
+        LandmarkTable.load(path, random_csr(0, n=31))
+
+    with open(path, 'wb') as f:
+        f.write(data[:-8])
+    with pytest.raises(ValueError, match='truncated'):
+        LandmarkTable.load(path, csr)
+
+
+def test_load_or_build_rebuilds_when_k_changes(tmp_path):
+    csr = random_csr(0)
+    path = str(tmp_path / 'alt')
+    table = LandmarkTable.load_or_build(path, csr, k=2)
+    assert table.k == 2
+    table = LandmarkTable.load_or_build(path, csr, k=2)
+    assert table.k == 2 and table._mapped is not None
+    table.close()
+    table = LandmarkTable.load_or_build(path, csr, k=5)
+    assert table.k == 5 and table._mapped is None
+    table = LandmarkTable.load(path, csr)
+    assert table.k == 5
+    table.close()
@@ -0,0 +1,68 @@
+import random
+from collections import deque
+
+from aisearch.graph import Graph
+from aisearch.spcache import INFINITY, ShortestPathCache
+
+
+def bfs(graph, source):
+    dist = {source: 0}
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        for neighbor in graph._graph.get(node, ()):
+            if neighbor not in dist:
+                dist[neighbor] = dist[node] + 1
+                queue.append(neighbor)
+    return dist
+
+
+def test_matches_bfs_after_random_edits():
+    for seed in range(100):
+        rng = random.Random(seed)
+        n = rng.randint(2, 20)
+        graph = Graph([(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(0, 3 * n))],
+                      directed=rng.random() < 0.5)
+        cache = ShortestPathCache(graph, capacity=rng.randint(1, 5))
+        for _ in range(50):
+            roll = rng.random()
+            if roll < 0.3:
+                graph.add(rng.randrange(n), rng.randrange(n))
+            elif roll < 0.4:
+                graph.remove(rng.randrange(n))
+            else:
+                source, target = rng.randrange(n), rng.randrange(n)
+                dist = bfs(graph, source)
+                path = cache.path(source, target)
+                assert cache.distance(source, target) == dist.get(target, INFINITY)
+                if target not in dist:
+                    assert path is None
+                else:
+                    assert path[0] == source and path[-1] == target
+                    assert len(path) - 1 == dist[target]
+                    assert all(graph.is_connected(a, b) for a, b in zip(path, path[1:]))
+
+
+def test_edits_repair_instead_of_flushing():
+    graph = Graph([('a', 'b'), ('b', 'c'), ('c', 'd')], directed=True)
+    cache = ShortestPathCache(graph)
+    assert cache.path('a', 'd') == ['a', 'b', 'c', 'd']
+    graph.add('a', 'c')
+    assert cache.path('a', 'd') == ['a', 'c', 'd']
+    graph.remove('c')
+    assert cache.path('a', 'd') is None
+    assert cache.stats()['misses'] == 1
+
+
+def test_closed_cache_is_not_notified():
+    graph = Graph([('a', 'b')], directed=True)
+    cache = ShortestPathCache(graph)
+    assert cache.path('a', 'b') == ['a', 'b']
+    cache.close()
+    graph.add('b', 'c')
+    graph.remove('a')
+    assert cache.stats()['repairs'] == 0 and cache.stats()['invalidations'] == 0
+    assert cache.stats()['size'] == 0
+    with ShortestPathCache(graph) as other:
+        assert other.path('b', 'c') == ['b', 'c']
+    assert graph._listeners == []